@@ -47,17 +47,40 @@ Updated: 2026-01-18 (Added LLM integration)
 # IMPORTS - These are tools from other Python libraries we need
 # ==============================================================================
 
+import collections  # For handy containers like deque
+import functools  # For remembering results we've already worked out
+import hashlib  # For turning cache keys into safe file names
+import json  # For saving parsed recipes to the on-disk cache
+import logging  # For progress messages that can be turned down or off
+import os  # For checking when a file was last changed
 import random  # For adding variety to recipe selection
 import re  # For finding patterns in text (like extracting recipe info)
+import shutil  # For clearing out outdated cache folders
+import sys  # For sending progress messages to the screen
 import yaml  # For reading YAML configuration files
-from datetime import datetime, timedelta  # For working with dates
+from concurrent.futures import ThreadPoolExecutor  # For reading many files at once
+from datetime import date, datetime, timedelta  # For working with dates
 from pathlib import Path  # For handling file paths in a smart way
-from typing import Any, Optional  # For type hints (helps catch bugs)
+from typing import Any, Collection, Optional  # For type hints (helps catch bugs)
+
+# Use the fast C-based YAML reader when PyYAML was built with libyaml
+# Otherwise fall back to the pure-Python reader - both are "safe" loaders
+# that only build plain data (no running arbitrary code from the file)
+YamlSafeLoader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Progress messages go through logging instead of print, so they can be
+# quieted (e.g., THC_LOGLEVEL=WARNING in CI) without touching the code.
+# When a message is turned off, Python doesn't even build the text for it.
+logger = logging.getLogger(__name__)
 
 # Import our LLM utility module for AI-powered meal suggestions
 # This is in a try/except so the script still works if llm_utils isn't available
 try:
-    from llm_utils import get_meal_suggestion, get_llm_status_message
+    from llm_utils import (
+        get_meal_suggestion,
+        get_llm_status_message,
+        is_llm_available,
+    )
 
     LLM_UTILS_AVAILABLE = True
 except ImportError:
@@ -74,7 +97,6 @@ try:
     HISTORY_UTILS_AVAILABLE = True
 except ImportError:
     HISTORY_UTILS_AVAILABLE = False
-    print("⚠️  Warning: history_utils not available - history tracking disabled")
 
 # Import variety scoring utilities
 try:
@@ -83,7 +105,6 @@ try:
     SCORING_UTILS_AVAILABLE = True
 except ImportError:
     SCORING_UTILS_AVAILABLE = False
-    print("⚠️  Warning: variety_scoring not available - scoring disabled")
 
 # Import grocery list generator utilities
 try:
@@ -92,7 +113,6 @@ try:
     GROCERY_LIST_UTILS_AVAILABLE = True
 except ImportError:
     GROCERY_LIST_UTILS_AVAILABLE = False
-    print("⚠️  Warning: grocery_list_generator not available - grocery lists disabled")
 
 
 # ==============================================================================
@@ -104,6 +124,57 @@ except ImportError:
 # and don't help identify the specific recipe
 MIN_WORD_LENGTH_FOR_MATCHING = 3
 
+# The meals we plan for each day, in the order they appear in the plan
+MEAL_TYPES = ("breakfast", "lunch", "dinner")
+
+# Section headings for each meal type in the saved Markdown plan
+MEAL_TYPE_HEADINGS = {
+    "breakfast": "### Breakfast",
+    "lunch": "### Lunch",
+    "dinner": "### Dinner",
+}
+
+# Recipe details we copy into the saved plan under each meal, in order
+MEAL_DETAIL_FIELDS = ("Prep Time", "Cook Time", "Total Time")
+
+# Text patterns used when reading recipe and profile files
+# We compile these once when the script starts instead of every time we read a
+# file or check a recipe, because compiling a pattern is surprisingly slow
+# compared to using it.
+
+# Matches a single line that is a bullet point with a bold label,
+# like "- **Category**: Breakfast"
+BULLET_PATTERN = re.compile(r"-\s+\*\*([^*]+)\*\*:\s+(.+)")
+
+# Where we keep already-parsed recipe files between runs
+# Recipes rarely change, so we remember what we found in each file and only
+# re-read a file when its size or modification time changes.
+PARSE_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "recipes"
+
+# A fingerprint of this script's code
+# Cached results live in a folder named after it, so any change to the parser
+# automatically starts a fresh cache instead of returning stale results.
+PARSER_SOURCE_HASH = hashlib.blake2b(
+    Path(__file__).read_bytes(), digest_size=8
+).hexdigest()
+
+# Where we keep finished meal plans between runs
+# If nothing that goes into a plan has changed (profile, recipes, constraints,
+# recent history, or this script itself), we can reuse the old plan.
+PLAN_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "plans"
+
+# Environment variable that controls how chatty the script is
+# (DEBUG, INFO, WARNING, ERROR - default is INFO)
+LOG_LEVEL_ENV_VAR = "THC_LOGLEVEL"
+
+# Libraries that log every HTTP request at INFO level (the OpenAI package and
+# the HTTP client it uses). We only show their warnings and errors.
+QUIET_LIBRARY_LOGGERS = ("httpx", "openai")
+
+# Below this many recipe files we just read them one at a time
+# Starting worker threads costs more than it saves for a handful of small files
+MIN_FILES_FOR_PARALLEL_LOAD = 8
+
 
 # ==============================================================================
 # HELPER FUNCTIONS - Small functions that do one specific job
@@ -130,25 +201,30 @@ def parse_markdown_file(file_path: Path) -> dict[str, Any]:
 
         We'll extract: {'title': 'Recipe Name', 'Category': 'Breakfast', ...}
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        content = f.read()
+    content = file_path.read_text(encoding="utf-8")
 
     # Create a box to store all the information we find
     data = {}
 
-    # Find the title (the first big heading with # in Markdown)
-    title_match = re.search(r"^#\s+(.+)$", content, re.MULTILINE)
-    if title_match:
-        data["title"] = title_match.group(1).strip()
+    # Go through the file one line at a time
+    for line in content.split("\n"):
+        # Find the title (the first big heading with # in Markdown)
+        # "## Heading" doesn't count - only a single # followed by a space
+        if "title" not in data and line[:1] == "#" and line[1:2] in (" ", "\t"):
+            data["title"] = line[1:].strip()
+            continue
 
-    # Find all the bullet points with bold labels like "- **Key**: Value"
-    # This pattern looks complicated, but it just finds text like:
-    # - **Category**: Breakfast
-    pattern = r"^-\s+\*\*([^*]+)\*\*:\s+(.+)$"
-    for match in re.finditer(pattern, content, re.MULTILINE):
-        key = match.group(1).strip()
-        value = match.group(2).strip()
-        data[key] = value
+        # Find all the bullet points with bold labels like "- **Key**: Value"
+        # Most lines can't possibly match, so we do a quick check before
+        # using the pattern. The pattern just finds text like:
+        # - **Category**: Breakfast
+        if not line.startswith("-") or "**:" not in line:
+            continue
+        match = BULLET_PATTERN.fullmatch(line)
+        if match:
+            key = match.group(1).strip()
+            value = match.group(2).strip()
+            data[key] = value
 
     # Store the full content too, in case we need it later
     data["content"] = content
@@ -156,6 +232,138 @@ def parse_markdown_file(file_path: Path) -> dict[str, Any]:
     return data
 
 
+@functools.lru_cache(maxsize=None)
+def _get_parse_cache_dir() -> Optional[Path]:
+    """Return the on-disk parse cache folder for this version of the parser.
+
+    Folders left behind by older versions of the parser can never be used
+    again, so they are deleted the first time we need the cache.
+
+    Returns:
+        The cache folder, or None if it can't be created
+    """
+    cache_dir = PARSE_CACHE_DIR / PARSER_SOURCE_HASH
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for old_entry in PARSE_CACHE_DIR.iterdir():
+            if old_entry != cache_dir:
+                if old_entry.is_dir():
+                    shutil.rmtree(old_entry, ignore_errors=True)
+                else:
+                    old_entry.unlink(missing_ok=True)
+    except OSError:
+        return None  # Read-only checkout, full disk, etc. - just don't cache
+    return cache_dir
+
+
+@functools.lru_cache(maxsize=None)
+def _load_parsed_markdown(path_str: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Parse a Markdown file, using the on-disk cache when it is still fresh.
+
+    The modification time and size are part of the arguments so that
+    lru_cache (and the on-disk cache) automatically miss when the file changes.
+    Each file has a single on-disk entry that is overwritten when the file
+    changes, so the cache doesn't keep growing.
+    """
+    cache_dir = _get_parse_cache_dir()
+    if cache_dir is None:
+        return parse_markdown_file(Path(path_str))
+
+    digest = hashlib.blake2b(path_str.encode("utf-8"), digest_size=16).hexdigest()
+    cache_path = cache_dir / f"{digest}.json"
+
+    # Cache hit - reuse what we parsed last time, as long as the file
+    # hasn't changed since then
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached: object = json.load(f)
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == mtime_ns
+            and cached.get("size") == size
+            and isinstance(cached.get("data"), dict)
+        ):
+            cached_data: dict[str, Any] = cached["data"]
+            return cached_data
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache entry - parse the file instead
+
+    data = parse_markdown_file(Path(path_str))
+
+    # Remember the result for next time, but never fail just because the
+    # cache folder can't be written (read-only checkout, full disk, etc.)
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"mtime_ns": mtime_ns, "size": size, "data": data},
+                f,
+                ensure_ascii=False,
+            )
+    except OSError:
+        pass
+
+    return data
+
+
+def parse_markdown_file_cached(
+    file_path: Path,
+    stat: Optional[os.stat_result] = None,
+) -> dict[str, Any]:
+    """Read a Markdown file like parse_markdown_file, but remember the result.
+
+    Results are cached in memory for this run and on disk (in .cache/recipes/)
+    for later runs. A file is only parsed again when its size or modification
+    time changes.
+
+    Args:
+        file_path: The location of the Markdown file to read
+        stat: Optional file info we already have (e.g., from os.scandir),
+              so we don't have to ask the operating system for it again
+
+    Returns:
+        A fresh copy of the extracted info, safe for the caller to modify
+
+    Example:
+        recipe = parse_markdown_file_cached(Path("recipes/fish-tacos.md"))
+        recipe["filename"] = "fish-tacos.md"  # Doesn't affect the cache
+    """
+    if stat is None:
+        stat = os.stat(file_path)
+    data = _load_parsed_markdown(str(file_path), stat.st_mtime_ns, stat.st_size)
+    return dict(data)
+
+
+def extract_first_number(text: str) -> Optional[int]:
+    """Find the first whole number in a piece of text.
+
+    Recipe times are short strings like "35 minutes", so a simple scan over
+    the characters is much cheaper than running a regular expression.
+
+    Args:
+        text: The text to look through
+
+    Returns:
+        The first number found, or None if the text has no digits
+
+    Example:
+        extract_first_number("5 minutes (+ overnight refrigeration)")  # 5
+        extract_first_number("About an hour")  # None
+    """
+    length = len(text)
+
+    # Skip ahead to the first digit
+    start = 0
+    while start < length and not text[start].isdecimal():
+        start += 1
+
+    # Then keep going until the digits stop
+    end = start
+    while end < length and text[end].isdecimal():
+        end += 1
+
+    return int(text[start:end]) if end > start else None
+
+
 def load_profile(profile_path: Path) -> dict[str, Any]:
     """Load a user profile from a Markdown file.
 
@@ -175,8 +383,8 @@ def load_profile(profile_path: Path) -> dict[str, Any]:
         profile = load_profile(Path("profiles/ashuah.md"))
         print(profile['Name'])  # "Ashuah Patel"
     """
-    print(f"📋 Loading profile from {profile_path.name}...")
-    return parse_markdown_file(profile_path)
+    logger.info("📋 Loading profile from %s...", profile_path.name)
+    return parse_markdown_file_cached(profile_path)
 
 
 def load_recipes(recipes_dir: Path) -> list[dict[str, Any]]:
@@ -195,24 +403,104 @@ def load_recipes(recipes_dir: Path) -> list[dict[str, Any]]:
         recipes = load_recipes(Path("recipes/"))
         print(f"Found {len(recipes)} recipes!")
     """
-    print(f"📖 Loading recipes from {recipes_dir}...")
-    recipes = []
+    logger.info("📖 Loading recipes from %s...", recipes_dir)
 
-    # Look at every file in the recipes folder
-    for recipe_file in recipes_dir.glob("*.md"):
-        # Skip special files that aren't recipes
-        if recipe_file.name == ".gitkeep":
-            continue
+    # Look at every Markdown file in the recipes folder, skipping special
+    # files that aren't recipes. os.scandir hands us each file's details as
+    # it goes, which we reuse for the parse cache instead of asking again.
+    try:
+        with os.scandir(recipes_dir) as entries:
+            recipe_entries = [
+                entry
+                for entry in entries
+                if entry.name.endswith(".md")
+                and entry.name != ".gitkeep"
+                and entry.is_file()
+            ]
+    except FileNotFoundError:
+        recipe_entries = []  # No recipes folder means no recipes
+    # Sort by name so recipes come out in the same order on every computer
+    # (folders don't promise any particular order)
+    recipe_entries.sort(key=lambda entry: entry.name)
+    recipe_files = [Path(entry.path) for entry in recipe_entries]
+    recipe_stats = [entry.stat() for entry in recipe_entries]
+
+    # Read the recipes - for a big collection, read several files at the same
+    # time since most of the work is waiting on the disk
+    if len(recipe_files) < MIN_FILES_FOR_PARALLEL_LOAD:
+        recipes = [
+            parse_markdown_file_cached(path, stat)
+            for path, stat in zip(recipe_files, recipe_stats)
+        ]
+    else:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            recipes = list(
+                executor.map(parse_markdown_file_cached, recipe_files, recipe_stats)
+            )
 
-        # Read the recipe and add it to our list
-        recipe = parse_markdown_file(recipe_file)
+    # Remember which file each recipe came from, and work out the details
+    # we check over and over while planning
+    for recipe, recipe_file in zip(recipes, recipe_files):
         recipe["filename"] = recipe_file.name
-        recipes.append(recipe)
+        add_recipe_lookup_fields(recipe)
 
-    print(f"   Found {len(recipes)} recipe(s)")
+    logger.info("   Found %d recipe(s)", len(recipes))
     return recipes
 
 
+def add_recipe_lookup_fields(recipe: dict[str, Any]) -> dict[str, Any]:
+    """Work out recipe details that planning needs again and again.
+
+    While building a week we look at every recipe's category and cooking time
+    for every meal slot. Instead of re-reading the text each time, we figure
+    them out once and store them on the recipe:
+    - "category_lower": the Category in lowercase (e.g., "breakfast")
+    - "recipe_minutes": the number from Total Time, or None if there isn't one
+    - "title_lower": the title in lowercase, for matching LLM suggestions
+    - "title_words": the significant words of the title, also for matching
+
+    Args:
+        recipe: The recipe dictionary to update
+
+    Returns:
+        The same recipe dictionary, for convenience
+
+    Example:
+        recipe = {"Category": "Dinner", "Total Time": "25 minutes"}
+        add_recipe_lookup_fields(recipe)
+        print(recipe["category_lower"], recipe["recipe_minutes"])  # dinner 25
+    """
+    recipe["category_lower"] = recipe.get("Category", "").lower()
+    recipe["recipe_minutes"] = extract_first_number(recipe.get("Total Time", ""))
+    title = recipe.get("title", "")
+    recipe["title_lower"] = title.lower()
+    recipe["title_words"] = tuple(extract_significant_words(title))
+    return recipe
+
+
+def group_recipes_by_category(
+    recipes: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Sort recipes into groups by their lowercase category.
+
+    Args:
+        recipes: Recipes prepared with add_recipe_lookup_fields
+
+    Returns:
+        Dictionary mapping each category (e.g., "dinner") to its recipes,
+        in the same order they appear in the input list
+
+    Example:
+        by_category = group_recipes_by_category(recipes)
+        dinners = by_category.get("dinner", [])
+    """
+    by_category: dict[str, list[dict[str, Any]]] = {}
+    for recipe in recipes:
+        by_category.setdefault(recipe["category_lower"], []).append(recipe)
+    return by_category
+
+
 def load_constraints(constraints_path: Path) -> dict[str, Any]:
     """Load planning constraints from a YAML file.
 
@@ -231,9 +519,116 @@ def load_constraints(constraints_path: Path) -> dict[str, Any]:
         constraints = load_constraints(Path("constraints/sample_constraints.yaml"))
         max_time = constraints['time']['max_weeknight_prep_minutes']
     """
-    print(f"⚙️  Loading constraints from {constraints_path.name}...")
+    logger.info("⚙️  Loading constraints from %s...", constraints_path.name)
     with open(constraints_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        constraints = yaml.load(f, Loader=YamlSafeLoader)
+    return normalize_constraints(constraints)
+
+
+def _coerce_int_setting(
+    section: dict[str, Any],
+    key: str,
+    path: str,
+    minimum: Optional[int] = None,
+) -> None:
+    """Turn one number setting into an int, in place, if it is present.
+
+    Args:
+        section: The constraints section holding the setting
+        key: Name of the setting inside the section
+        path: Full dotted name of the setting (for error messages)
+        minimum: Optional smallest allowed value
+
+    Raises:
+        ValueError: If the setting is not a whole number, or is smaller
+            than minimum
+    """
+    if key not in section:
+        return
+    value = section[key]
+    error_message = (
+        f"Constraints setting '{path}' must be a whole number, got {value!r}."
+    )
+
+    # int() would quietly turn True into 1 and 2.7 into 2, so refuse those
+    # instead of planning with a number nobody wrote
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(error_message)
+
+    try:
+        section[key] = int(value)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(error_message) from exc
+
+    if minimum is not None and section[key] < minimum:
+        raise ValueError(
+            f"Constraints setting '{path}' must be at least {minimum}, "
+            f"got {value!r}."
+        )
+
+
+def normalize_constraints(constraints: Any) -> dict[str, Any]:
+    """Check the constraints once and tidy up their value types.
+
+    YAML is forgiving about types: a time limit can come back as the text
+    "45", and an unquoted date comes back as a date object instead of text.
+    We fix these up once when loading, so the planning code can trust the
+    numbers and dates it reads for every meal slot.
+
+    Args:
+        constraints: The constraints as read from the YAML file
+
+    Returns:
+        The same constraints dictionary, with numbers as ints and week dates
+        as "YYYY-MM-DD" text
+
+    Raises:
+        ValueError: If the file is not a mapping, a number setting is not
+            a whole number, or min_days_between_repeats is negative
+
+    Example:
+        constraints = normalize_constraints({"meals_per_day": {"dinner": "1"}})
+        constraints["meals_per_day"]["dinner"]  # 1
+    """
+    if not isinstance(constraints, dict):
+        raise ValueError("Constraints file must contain a mapping of settings.")
+
+    week_constraints = constraints.get("week")
+    if isinstance(week_constraints, dict):
+        for key in ("start_date", "end_date"):
+            value = week_constraints.get(key)
+            if isinstance(value, datetime):
+                value = value.date()
+            if isinstance(value, date):
+                week_constraints[key] = value.isoformat()
+
+    time_constraints = constraints.get("time")
+    if isinstance(time_constraints, dict):
+        for key in ("max_weeknight_prep_minutes", "max_weekend_prep_minutes"):
+            _coerce_int_setting(time_constraints, key, f"time.{key}")
+        no_cook_config = time_constraints.get("no_cook_nights")
+        if isinstance(no_cook_config, dict):
+            _coerce_int_setting(
+                no_cook_config,
+                "max_prep_minutes",
+                "time.no_cook_nights.max_prep_minutes",
+            )
+
+    meals_per_day = constraints.get("meals_per_day")
+    if isinstance(meals_per_day, dict):
+        for meal_type in list(meals_per_day):
+            _coerce_int_setting(meals_per_day, meal_type, f"meals_per_day.{meal_type}")
+
+    variety_config = constraints.get("variety")
+    if isinstance(variety_config, dict):
+        _coerce_int_setting(
+            variety_config,
+            "min_days_between_repeats",
+            "variety.min_days_between_repeats",
+            minimum=0,
+        )
+
+    return constraints
 
 
 def is_recipe_suitable(
@@ -268,34 +663,84 @@ def is_recipe_suitable(
         if is_recipe_suitable(recipe, profile, True, constraints, "Monday"):
             print("This recipe works for a weeknight!")
     """
-    # Get the time constraints with validation
+    max_minutes = get_recipe_time_limit(constraints, is_weeknight, day_name)
+    default_minutes = get_default_recipe_minutes(constraints)
+    return recipe_fits_time_limit(recipe, max_minutes, default_minutes)
+
+
+def get_time_constraints(constraints: dict[str, Any]) -> dict[str, Any]:
+    """Get the "time" section of the constraints, making sure it exists.
+
+    Args:
+        constraints: The planning rules
+
+    Returns:
+        The "time" section dictionary
+
+    Raises:
+        ValueError: If the constraints have no "time" section
+    """
     time_constraints = constraints.get("time")
     if not isinstance(time_constraints, dict):
         raise ValueError("Constraints file is missing required 'time' section.")
+    return time_constraints
+
+
+def get_default_recipe_minutes(constraints: dict[str, Any]) -> int:
+    """Get the cooking time we assume for recipes without a Total Time.
+
+    We assume such recipes take as long as the weeknight limit allows.
+
+    Args:
+        constraints: The planning rules
+
+    Returns:
+        Minutes to assume for recipes with no time info
 
-    # Get the default time for recipes without time info
+    Raises:
+        ValueError: If the constraints have no "time" section
+        KeyError: If time.max_weeknight_prep_minutes is missing
+    """
+    time_constraints = get_time_constraints(constraints)
     try:
-        default_time = time_constraints["max_weeknight_prep_minutes"]
+        default_minutes: int = time_constraints["max_weeknight_prep_minutes"]
     except KeyError as exc:
         raise KeyError(
             f"Constraints file is missing required key 'time.max_weeknight_prep_minutes'."
         ) from exc
+    return default_minutes
 
-    # Extract recipe preparation time
-    total_time_str = recipe.get("Total Time", f"{default_time} minutes")
-    time_match = re.search(r"(\d+)", total_time_str)
-    recipe_time = int(time_match.group(1)) if time_match else default_time
 
-    # Check for no-cook nights constraint
-    no_cook_config = time_constraints.get("no_cook_nights", {})
-    if no_cook_config.get("enabled", False) and day_name:
-        no_cook_days = no_cook_config.get("days", [])
-        if day_name in no_cook_days:
-            max_no_cook_time = no_cook_config.get("max_prep_minutes", 10)
-            if recipe_time > max_no_cook_time:
-                return False  # Too much cooking for a no-cook night!
+def get_recipe_time_limit(
+    constraints: dict[str, Any],
+    is_weeknight: bool,
+    day_name: str = "",
+) -> int:
+    """Work out the longest a recipe may take on a given day.
+
+    This combines the regular weeknight/weekend limit with the no-cook
+    night limit (if that day is a no-cook night). The answer is the same for
+    every recipe, so we work it out once and then compare each recipe to it.
+
+    Args:
+        constraints: The planning rules
+        is_weeknight: Is this a weeknight (Mon-Fri) or weekend?
+        day_name: Name of the day (for no-cook night checking)
+
+    Returns:
+        Maximum total minutes a recipe may take on this day
+
+    Raises:
+        ValueError: If the constraints have no "time" section
+        KeyError: If the weeknight/weekend limit for this day is missing
 
-    # Check regular time constraints
+    Example:
+        limit = get_recipe_time_limit(constraints, True, "Monday")  # e.g., 45
+    """
+    time_constraints = get_time_constraints(constraints)
+
+    # Regular time constraints
+    max_time: int
     try:
         if is_weeknight:
             max_time = time_constraints["max_weeknight_prep_minutes"]
@@ -307,10 +752,51 @@ def is_recipe_suitable(
             f"Constraints file is missing required key 'time.{missing_key}'."
         ) from exc
 
-    if recipe_time > max_time:
-        return False  # Too long to cook!
+    # No-cook nights have their own (usually much shorter) limit
+    no_cook_config = time_constraints.get("no_cook_nights", {})
+    if no_cook_config.get("enabled", False) and day_name:
+        no_cook_days = no_cook_config.get("days", [])
+        if day_name in no_cook_days:
+            max_no_cook_time = no_cook_config.get("max_prep_minutes", 10)
+            max_time = min(max_time, max_no_cook_time)
+
+    return max_time
+
 
-    return True  # Recipe is suitable!
+def recipe_fits_time_limit(
+    recipe: dict[str, Any],
+    max_minutes: int,
+    default_minutes: int,
+) -> bool:
+    """Check if a recipe can be made within a time limit.
+
+    This is the quick check we run for every recipe in every meal slot, so it
+    only compares numbers - the limits come from get_recipe_time_limit and
+    get_default_recipe_minutes.
+
+    Args:
+        recipe: The recipe we're considering
+        max_minutes: Longest the recipe may take
+        default_minutes: Minutes to assume if the recipe has no Total Time
+
+    Returns:
+        True if the recipe is quick enough, False if it takes too long
+
+    Example:
+        if recipe_fits_time_limit(recipe, 45, 45):
+            print("Quick enough for a weeknight!")
+    """
+    # Extract recipe preparation time
+    # Recipes from load_recipes already have this worked out for us
+    recipe_time: Optional[int]
+    if "recipe_minutes" in recipe:
+        recipe_time = recipe["recipe_minutes"]
+    else:
+        recipe_time = extract_first_number(recipe.get("Total Time", ""))
+    if recipe_time is None:
+        recipe_time = default_minutes
+
+    return recipe_time <= max_minutes
 
 
 def check_blocking_constraints(
@@ -448,15 +934,49 @@ def extract_significant_words(text: str) -> list[str]:
     ]
 
 
+def build_titles_by_filename(recipes: list[dict[str, Any]]) -> dict[str, str]:
+    """Make a lookup from recipe filename to recipe title.
+
+    Recipes without a filename or title are left out. If two recipes share
+    a filename, the first one wins.
+
+    Args:
+        recipes: List of recipe dictionaries
+
+    Returns:
+        Dictionary mapping each filename to its title
+
+    Example:
+        titles = build_titles_by_filename(recipes)
+        titles.get("pancakes.md")  # e.g., "Fluffy Pancakes"
+    """
+    titles_by_filename: dict[str, str] = {}
+    for recipe in recipes:
+        filename = recipe.get("filename")
+        title = recipe.get("title")
+        if filename and title and filename not in titles_by_filename:
+            titles_by_filename[filename] = title
+    return titles_by_filename
+
+
 def select_meal_with_llm(
     meal_type: str,
     recipes: list[dict[str, Any]],
     profile: dict[str, Any],
     is_weeknight: bool,
     constraints: dict[str, Any],
-    recently_used: list[str],
+    recently_used: Collection[str],
     day_name: str = "",
     recently_used_recipes_by_day: list[list[dict[str, Any]]] = None,
+    candidate_recipes: Optional[list[dict[str, Any]]] = None,
+    rng: Optional[random.Random] = None,
+    titles_by_filename: Optional[dict[str, str]] = None,
+    max_minutes: Optional[int] = None,
+    default_minutes: Optional[int] = None,
+    candidates_fit_time: bool = False,
+    llm_suggestion_cache: Optional[
+        dict[tuple[str, bool, tuple[str, ...]], Optional[str]]
+    ] = None,
 ) -> Optional[dict[str, Any]]:
     """Select a meal using LLM suggestions when available, with constraint validation.
 
@@ -470,13 +990,41 @@ def select_meal_with_llm(
 
     Args:
         meal_type: Type of meal (breakfast, lunch, dinner)
-        recipes: List of available recipe dictionaries
+        recipes: List of available recipe dictionaries (as returned by
+                 load_recipes, or prepared with add_recipe_lookup_fields)
         profile: User profile with preferences
         is_weeknight: True for weeknight, False for weekend
         constraints: Planning constraints
-        recently_used: List of recently used recipe filenames
+        recently_used: Recently used recipe filenames (a set is fastest, since
+                       we check every candidate recipe against it)
         day_name: Name of the day (for no-cook night checking)
         recently_used_recipes_by_day: List of days, each day is a list of recipes used that day
+        candidate_recipes: Optional list of recipes already known to be in this
+                           meal_type's category (see group_recipes_by_category).
+                           If not given, we pick them out of recipes ourselves.
+        rng: Optional random number generator used to pick among suitable
+             recipes. Pass a seeded random.Random for repeatable plans;
+             if not given, Python's shared random generator is used.
+        titles_by_filename: Optional lookup from recipe filename to title, so
+                            recently used recipes can be named for the LLM
+                            without searching the recipe list. If not given,
+                            we build it from recipes when it's needed.
+        max_minutes: Optional time limit for this day (see
+                     get_recipe_time_limit). If not given, we work it out
+                     from constraints.
+        default_minutes: Optional minutes to assume for recipes with no
+                         Total Time (see get_default_recipe_minutes). If not
+                         given, we work it out from constraints.
+        candidates_fit_time: Set to True when every recipe in
+                             candidate_recipes is already known to fit
+                             today's time limit, so we skip checking it again.
+        llm_suggestion_cache: Optional dictionary for remembering LLM
+                              suggestions during one planning run. Slots
+                              that ask the same question (same meal type,
+                              day type and recent meals) reuse the answer
+                              instead of calling the LLM again. Only share
+                              it between calls with the same profile and
+                              constraints.
 
     Returns:
         Selected recipe dictionary, or None if no suitable recipe found
@@ -496,12 +1044,25 @@ def select_meal_with_llm(
     if recently_used_recipes_by_day is None:
         recently_used_recipes_by_day = []
 
+    # Only recipes from the right category (breakfast, lunch, dinner) can be used
+    if candidate_recipes is None:
+        candidate_recipes = [r for r in recipes if r.get("category_lower") == meal_type]
+
+    # The time limit is the same for every recipe today, so work it out once
+    # (unless the caller already did)
+    if max_minutes is None:
+        max_minutes = get_recipe_time_limit(constraints, is_weeknight, day_name)
+    if default_minutes is None:
+        default_minutes = get_default_recipe_minutes(constraints)
+
     # First, filter recipes to only those that meet hard constraints
     suitable_recipes = [
         r
-        for r in recipes
-        if r.get("Category", "").lower() == meal_type
-        and is_recipe_suitable(r, profile, is_weeknight, constraints, day_name)
+        for r in candidate_recipes
+        if (
+            candidates_fit_time
+            or recipe_fits_time_limit(r, max_minutes, default_minutes)
+        )
         and r.get("filename") not in recently_used
         and check_blocking_constraints(r, recently_used_recipes_by_day, constraints)
     ]
@@ -514,25 +1075,28 @@ def select_meal_with_llm(
     llm_suggestion = None
     if LLM_UTILS_AVAILABLE:
         # Get recently used meal titles (not filenames) for context
-        recently_used_titles = []
-        for filename in recently_used:
-            # Find the recipe with this filename
-            for r in recipes:
-                if r.get("filename") == filename:
-                    title = r.get("title")
-                    if title:
-                        recently_used_titles.append(title)
-                    break
-
-        # Get LLM suggestion
-        llm_suggestion = get_meal_suggestion(
-            meal_type,
-            profile,
-            constraints,
-            is_weeknight,
-            recently_used_titles,
+        if titles_by_filename is None:
+            titles_by_filename = build_titles_by_filename(recipes)
+        # (sorted, so the same recent meals always ask the same question)
+        recently_used_titles = sorted(
+            title for title in map(titles_by_filename.get, recently_used) if title
         )
 
+        # Get LLM suggestion, reusing an earlier answer to the same question
+        cache_key = (meal_type, is_weeknight, tuple(recently_used_titles))
+        if llm_suggestion_cache is not None and cache_key in llm_suggestion_cache:
+            llm_suggestion = llm_suggestion_cache[cache_key]
+        else:
+            llm_suggestion = get_meal_suggestion(
+                meal_type,
+                profile,
+                constraints,
+                is_weeknight,
+                recently_used_titles,
+            )
+            if llm_suggestion_cache is not None:
+                llm_suggestion_cache[cache_key] = llm_suggestion
+
     # If we got an LLM suggestion, try to find a matching recipe
     # We do a simple string matching - if the LLM suggests something
     # similar to one of our recipes, prefer that one
@@ -541,54 +1105,199 @@ def select_meal_with_llm(
         llm_words = extract_significant_words(llm_suggestion)
 
         # Look for recipes that match the LLM suggestion
+        # (each recipe's lowercase title and words were worked out at load)
         for recipe in suitable_recipes:
-            recipe_title = recipe.get("title", "")
-            recipe_words = extract_significant_words(recipe_title)
-            recipe_lower = recipe_title.lower()
-
-            # Check bidirectional word matching: LLM words in recipe OR recipe words in LLM
-            # This catches both "Chicken Teriyaki" -> "Teriyaki Chicken Bowl"
-            # and "Grilled Salmon" -> "Salmon"
-            if any(word in recipe_lower for word in llm_words) or any(
-                word in llm_lower for word in recipe_words
+            recipe_words = recipe["title_words"]
+            recipe_lower = recipe["title_lower"]
+
+            # A recipe matches if either:
+            # - words match in either direction: LLM words in the recipe OR
+            #   recipe words in the LLM suggestion. This catches both
+            #   "Chicken Teriyaki" -> "Teriyaki Chicken Bowl" and
+            #   "Grilled Salmon" -> "Salmon"
+            # - or, failing that, one whole text contains the other. This
+            #   handles short names like "Tea" matching "Green Tea" or
+            #   "Pie" -> "Pi", which have no significant words to compare
+            # We take the first recipe that matches either way
+            if (
+                any(word in recipe_lower for word in llm_words)
+                or any(word in llm_lower for word in recipe_words)
+                or llm_lower in recipe_lower
+                or recipe_lower in llm_lower
             ):
                 # Found a match! Use this recipe
-                print(
-                    f"   🤖 LLM suggested '{llm_suggestion}', "
-                    f"matched with recipe: {recipe.get('title')}"
-                )
-                return recipe
-
-            # Per-recipe fallback: If word-based matching failed for this recipe,
-            # try exact substring matching between the LLM suggestion and this title.
-            # This handles cases like "Tea" matching "Green Tea" or "Pie" -> "Pi",
-            # even when other recipes have significant words.
-            if llm_lower in recipe_lower or recipe_lower in llm_lower:
-                print(
-                    f"   🤖 LLM suggested '{llm_suggestion}', "
-                    f"matched with recipe (substring): {recipe.get('title')}"
+                logger.info(
+                    "   🤖 LLM suggested '%s', matched with recipe: %s",
+                    llm_suggestion,
+                    recipe.get("title"),
                 )
                 return recipe
 
     # If no LLM suggestion or no matching recipe, use random selection
     # This is the original deterministic behavior
-    chosen = random.choice(suitable_recipes)
+    chosen = (rng or random).choice(suitable_recipes)
 
     # If we had an LLM suggestion but no match, note it
     if llm_suggestion:
-        print(
-            f"   🤖 LLM suggested '{llm_suggestion}' "
-            f"(no matching recipe, using: {chosen.get('title')})"
+        logger.info(
+            "   🤖 LLM suggested '%s' (no matching recipe, using: %s)",
+            llm_suggestion,
+            chosen.get("title"),
         )
 
     return chosen
 
 
+def load_history_recently_used(
+    constraints: dict[str, Any],
+    history_dir: Optional[Path],
+) -> list[str]:
+    """Find which recipes were used in recent meal plans.
+
+    Args:
+        constraints: Planning rules (the "history" section says whether
+                     history is enabled and how far back to look)
+        history_dir: Directory containing meal plan history, or None
+
+    Returns:
+        List of recipe filenames from recent history (empty if history is
+        disabled or unavailable)
+
+    Example:
+        used = load_history_recently_used(constraints, Path("history/"))
+        print(f"Avoiding {len(used)} recently used recipes")
+    """
+    if not (HISTORY_UTILS_AVAILABLE and history_dir):
+        return []
+
+    history_config = constraints.get("history", {})
+    if not history_config.get("enabled", False):
+        return []
+
+    logger.info("📚 Loading meal plan history...")
+    recent_from_history = get_recently_used_recipes(
+        history_dir,
+        days_back=history_config.get("ttl_days", 30),
+    )
+    history_recently_used = [
+        r["filename"] for r in recent_from_history if r.get("filename")
+    ]
+    if history_recently_used:
+        logger.info(
+            "   Found %d recipes used in recent history", len(history_recently_used)
+        )
+    return history_recently_used
+
+
+def compute_plan_cache_key(
+    profile: dict[str, Any],
+    recipes: list[dict[str, Any]],
+    constraints: dict[str, Any],
+    history_recently_used: list[str],
+) -> str:
+    """Make a fingerprint of everything that decides what the meal plan is.
+
+    Two runs with the same fingerprint will pick exactly the same meals
+    (recipe picks are seeded from the profile and week), so the plan from
+    the first run can be reused. This script's own code is part of the
+    fingerprint too, so changing how plans are made never reuses old plans.
+
+    Args:
+        profile: The person's profile
+        recipes: List of available recipes
+        constraints: Planning rules
+        history_recently_used: Recipe filenames from recent history
+
+    Returns:
+        A short hex string that changes whenever any input changes
+
+    Example:
+        key = compute_plan_cache_key(profile, recipes, constraints, [])
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(Path(__file__).read_bytes())
+    inputs = {
+        "profile": profile,
+        "recipes": recipes,
+        "constraints": constraints,
+        "history": history_recently_used,
+    }
+    hasher.update(json.dumps(inputs, sort_keys=True, default=str).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def load_cached_meal_plan(cache_key: str) -> Optional[dict[str, Any]]:
+    """Load a previously generated meal plan from the plan cache.
+
+    Args:
+        cache_key: Fingerprint from compute_plan_cache_key
+
+    Returns:
+        The cached meal plan, or None if there isn't a usable one
+    """
+    cache_path = PLAN_CACHE_DIR / f"{cache_key}.json"
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached_plan: object = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    # Anything other than a plan dictionary means the file isn't usable
+    if not isinstance(cached_plan, dict):
+        return None
+    return cached_plan
+
+
+def save_cached_meal_plan(cache_key: str, meal_plan: dict[str, Any]) -> None:
+    """Save a generated meal plan to the plan cache for future runs.
+
+    Failing to write the cache is never an error - we just won't get to
+    reuse this plan next time.
+
+    Args:
+        cache_key: Fingerprint from compute_plan_cache_key
+        meal_plan: The generated meal plan
+    """
+    try:
+        PLAN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(PLAN_CACHE_DIR / f"{cache_key}.json", "w", encoding="utf-8") as f:
+            json.dump(meal_plan, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def parse_week_date(date_str: str) -> date:
+    """Read a "YYYY-MM-DD" date from the constraints' week section.
+
+    Dates are usually plain zero-padded text, which date.fromisoformat reads
+    directly (much quicker than the general-purpose strptime). Before Python
+    3.11 it doesn't accept unpadded dates like "2026-1-5", so those are read
+    with strptime instead.
+
+    Args:
+        date_str: The date text, e.g. "2026-01-20"
+
+    Returns:
+        The date
+
+    Raises:
+        ValueError: If the text is not a valid date
+
+    Example:
+        parse_week_date("2026-1-5")  # date(2026, 1, 5)
+    """
+    try:
+        return date.fromisoformat(date_str)
+    except ValueError:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+
+
 def generate_meal_plan(
     profile: dict[str, Any],
     recipes: list[dict[str, Any]],
     constraints: dict[str, Any],
     history_dir: Optional[Path] = None,
+    history_recently_used: Optional[list[str]] = None,
 ) -> tuple[dict[str, Any], list[str]]:
     """Generate a weekly meal plan.
 
@@ -606,6 +1315,10 @@ def generate_meal_plan(
         recipes: List of available recipes
         constraints: Planning rules
         history_dir: Optional directory containing meal plan history
+        history_recently_used: Optional recipe filenames from recent history,
+                               if the caller already loaded them (see
+                               load_history_recently_used). If not given,
+                               history is loaded from history_dir.
 
     Returns:
         A tuple of (meal_plan dict, list of recently used recipe filenames from history)
@@ -614,7 +1327,7 @@ def generate_meal_plan(
         plan, history_used = generate_meal_plan(profile, recipes, constraints)
         print(plan['week']['Monday']['breakfast']['title'])
     """
-    print("\n🎯 Generating meal plan...")
+    logger.info("\n🎯 Generating meal plan...")
 
     # Get the start and end dates for the week, with validation so we can
     # provide clear error messages if the constraints file is misconfigured.
@@ -631,8 +1344,8 @@ def generate_meal_plan(
             f"Constraints file is missing required key 'week.{missing_key}'."
         ) from exc
 
-    start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-    end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+    start_date = parse_week_date(start_date_str)
+    end_date = parse_week_date(end_date_str)
 
     # Validate that start_date is not after end_date
     if start_date > end_date:
@@ -641,48 +1354,104 @@ def generate_meal_plan(
             "Please ensure start_date comes before or equals end_date."
         )
 
+    # Make sure every recipe has its lookup details worked out
+    # (recipes from load_recipes already do, so this is usually a no-op)
+    for recipe in recipes:
+        if "title_words" not in recipe:
+            add_recipe_lookup_fields(recipe)
+
+    # Pick recipes with our own random generator, seeded from the profile
+    # and the week. Planning the same week for the same person twice gives
+    # the same plan, while different weeks still get different meals.
+    rng = random.Random(f"{profile.get('Name', '')}|{start_date_str}")
+
+    # Sort recipes into piles by category once, so each meal slot only has to
+    # look through its own pile instead of every recipe we have
+    recipes_by_category = group_recipes_by_category(recipes)
+
+    # Recently used recipes are tracked by filename, but the LLM needs their
+    # titles, so make a quick lookup from one to the other
+    titles_by_filename = build_titles_by_filename(recipes)
+
+    # LLM answers for this run, so identical questions are only asked once
+    llm_suggestion_cache: dict[tuple[str, bool, tuple[str, ...]], Optional[str]] = {}
+
     # Create the structure to hold our meal plan
     meal_plan = {
         "profile_name": profile.get("Name", "Unknown"),
-        "week_start": start_date.strftime("%Y-%m-%d"),
-        "week_end": end_date.strftime("%Y-%m-%d"),
+        "week_start": start_date.isoformat(),
+        "week_end": end_date.isoformat(),
         "week": {},  # This will hold all the daily meals
     }
 
     # Keep track of recently used recipes to avoid repetition
-    recently_used = []
+    # - recent_picks holds this week's most recent picks; the deque drops the
+    #   oldest pick by itself once it's full
+    # - recently_used holds every filename we must avoid (history + recent
+    #   picks) as a set, so "have we used this?" is a quick lookup
+    # A min_days_between_repeats of 0 means "never forget a pick", so the
+    # deque gets no size limit at all.
+    max_recently_used = constraints.get("variety", {}).get(
+        "min_days_between_repeats", 3
+    )
+    recent_picks: collections.deque[str] = collections.deque(
+        maxlen=max_recently_used or None
+    )
+    recently_used = set()
     recently_used_recipes_by_day = (
         []
     )  # Track recipes grouped by day for blocking constraints
     current_day_recipes = []  # Accumulate recipes for the current day
 
-    # Load history if available and enabled
-    history_recently_used = []
-    if HISTORY_UTILS_AVAILABLE and history_dir:
-        history_config = constraints.get("history", {})
-        if history_config.get("enabled", False):
-            print("📚 Loading meal plan history...")
-            recent_from_history = get_recently_used_recipes(
-                history_dir,
-                days_back=history_config.get("ttl_days", 30),
-            )
-            history_recently_used = [
-                r["filename"] for r in recent_from_history if r.get("filename")
-            ]
-            if history_recently_used:
-                print(
-                    f"   Found {len(history_recently_used)} recipes used in recent history"
-                )
-            # Combine with current week's tracking
-            recently_used.extend(history_recently_used)
+    # Load history if available and enabled (unless the caller already did)
+    if history_recently_used is None:
+        history_recently_used = load_history_recently_used(constraints, history_dir)
+
+    # Combine with current week's tracking
+    recently_used.update(history_recently_used)
 
-    # Loop through each day in the configured week, using actual calendar dates
-    current_date = start_date
-    while current_date <= end_date:
-        # Use the actual day name from the current date (e.g., Monday, Tuesday, ...)
-        day_name = current_date.strftime("%A")
-        # Is this a weeknight? (Monday = 0, Sunday = 6)
-        is_weeknight = current_date.weekday() < 5  # Monday-Friday
+    # History recipes are always avoided, no matter how many picks we make
+    history_recently_used_set = set(history_recently_used)
+
+    # Some settings are the same for every day, so look them up just once
+    # Which meals do we need each day? (e.g., skip snacks if we need 0)
+    meals_per_day = constraints["meals_per_day"]
+    needed_meal_types = [mt for mt in MEAL_TYPES if meals_per_day.get(mt, 0) > 0]
+
+    # How many days of recipes do blocking checks need to look back on?
+    # Keep only enough days for the longest blocking constraint
+    blocking_config = constraints.get("blocking", {})
+    max_blocking_days = max(
+        blocking_config.get("protein_blocking", {}).get("max_consecutive_days", 1),
+        blocking_config.get("cuisine_blocking", {}).get("max_consecutive_days", 2),
+        blocking_config.get("cooking_method_blocking", {}).get(
+            "max_consecutive_days", 2
+        ),
+    )
+
+    # Minutes to assume for recipes that don't say how long they take
+    default_minutes = get_default_recipe_minutes(constraints)
+
+    # Recipes that fit in time, by (meal type, time limit). Most days share
+    # a limit (every weeknight, every weekend day), so we only sort out which
+    # recipes are quick enough the first time we see each combination
+    time_suitable_pools: dict[tuple[str, int], list[dict[str, Any]]] = {}
+
+    # Work out each day in the configured week up front, using actual
+    # calendar dates:
+    # - the day name from the date (e.g., Monday, Tuesday, ...)
+    # - is this a weeknight? (Monday = 0, Sunday = 6, so Monday-Friday is < 5)
+    num_days = (end_date - start_date).days + 1
+    plan_days = []
+    for day_offset in range(num_days):
+        day_date = start_date + timedelta(days=day_offset)
+        plan_days.append((day_date.strftime("%A"), day_date.weekday() < 5))
+
+    # Loop through each day in the configured week
+    for day_name, is_weeknight in plan_days:
+
+        # Every meal today shares the same time limit, so work it out once
+        max_minutes = get_recipe_time_limit(constraints, is_weeknight, day_name)
 
         # Start a new day - reset the current day's recipe list
         current_day_recipes = []
@@ -690,68 +1459,63 @@ def generate_meal_plan(
         # Create a place to store today's meals
         daily_meals = {}
 
-        # For each meal type (breakfast, lunch, dinner)
-        meal_types = ["breakfast", "lunch", "dinner"]
-        for meal_type in meal_types:
-            # How many of this meal type do we need?
-            needed = constraints["meals_per_day"].get(meal_type, 0)
-
-            if needed > 0:
-                # Use LLM-aware meal selection
-                # This will try to use LLM suggestions when available,
-                # but always fall back to deterministic selection
-                chosen_recipe = select_meal_with_llm(
-                    meal_type,
-                    recipes,
-                    profile,
-                    is_weeknight,
-                    constraints,
-                    recently_used,
-                    day_name,
-                    recently_used_recipes_by_day,
-                )
+        # For each meal type we need (breakfast, lunch, dinner)
+        for meal_type in needed_meal_types:
+            pool_key = (meal_type, max_minutes)
+            time_suitable_pool = time_suitable_pools.get(pool_key)
+            if time_suitable_pool is None:
+                time_suitable_pool = [
+                    r
+                    for r in recipes_by_category.get(meal_type, [])
+                    if recipe_fits_time_limit(r, max_minutes, default_minutes)
+                ]
+                time_suitable_pools[pool_key] = time_suitable_pool
+
+            # Use LLM-aware meal selection
+            # This will try to use LLM suggestions when available,
+            # but always fall back to deterministic selection
+            chosen_recipe = select_meal_with_llm(
+                meal_type,
+                recipes,
+                profile,
+                is_weeknight,
+                constraints,
+                recently_used,
+                day_name,
+                recently_used_recipes_by_day,
+                time_suitable_pool,
+                rng,
+                titles_by_filename,
+                max_minutes,
+                default_minutes,
+                candidates_fit_time=True,
+                llm_suggestion_cache=llm_suggestion_cache,
+            )
 
-                if chosen_recipe:
-                    daily_meals[meal_type] = chosen_recipe
-
-                    # Add to current day's recipes for blocking constraint tracking
-                    current_day_recipes.append(chosen_recipe)
-
-                    # Remember we used this recipe (only from current week, not history)
-                    if chosen_recipe.get("filename") not in history_recently_used:
-                        recently_used.append(chosen_recipe.get("filename"))
-
-                    # Keep the recently_used list from getting too long
-                    # Use the variety constraint to determine how long to track
-                    max_recently_used = constraints.get("variety", {}).get(
-                        "min_days_between_repeats", 3
-                    )
-                    # Add buffer for history items
-                    max_tracking = max_recently_used + len(history_recently_used)
-                    if len(recently_used) > max_tracking:
-                        # Only remove items not from history
-                        # Create a new list with items to keep
-                        items_to_keep = [
-                            item
-                            for item in recently_used
-                            if item in history_recently_used
-                        ]
-                        # Keep the most recent non-history items
-                        non_history_items = [
-                            item
-                            for item in recently_used
-                            if item not in history_recently_used
-                        ]
-                        if non_history_items:
-                            # Keep only the most recent max_recently_used items
-                            items_to_keep.extend(non_history_items[-max_recently_used:])
-                        recently_used = items_to_keep
-                else:
-                    # No suitable recipes found - note this in the plan
-                    daily_meals[meal_type] = {
-                        "title": f"No {meal_type} recipe available",
-                        "note": "Consider adding more recipes to the database",
-                    }
+            if chosen_recipe:
+                daily_meals[meal_type] = chosen_recipe
+
+                # Add to current day's recipes for blocking constraint tracking
+                current_day_recipes.append(chosen_recipe)
+
+                # Remember we used this recipe (only from current week, not history)
+                # (recipes are tracked by filename, so one without a
+                # filename can't be remembered)
+                filename = chosen_recipe.get("filename")
+                if filename is not None and filename not in history_recently_used_set:
+                    # Keep the list from getting too long - only the last
+                    # few picks (min_days_between_repeats) are tracked, so
+                    # forget the oldest one before the deque drops it
+                    if len(recent_picks) == recent_picks.maxlen:
+                        recently_used.discard(recent_picks[0])
+                    recent_picks.append(filename)
+                    recently_used.add(filename)
+            else:
+                # No suitable recipes found - note this in the plan
+                daily_meals[meal_type] = {
+                    "title": f"No {meal_type} recipe available",
+                    "note": "Consider adding more recipes to the database",
+                }
 
         # Add today's meals to the weekly plan
         meal_plan["week"][day_name] = daily_meals
@@ -762,27 +1526,12 @@ def generate_meal_plan(
             recently_used_recipes_by_day.append(current_day_recipes)
 
             # Trim the by-day list to avoid unbounded growth
-            # Keep only enough days for the longest blocking constraint
-            max_blocking_days = max(
-                constraints.get("blocking", {})
-                .get("protein_blocking", {})
-                .get("max_consecutive_days", 1),
-                constraints.get("blocking", {})
-                .get("cuisine_blocking", {})
-                .get("max_consecutive_days", 2),
-                constraints.get("blocking", {})
-                .get("cooking_method_blocking", {})
-                .get("max_consecutive_days", 2),
-            )
             if len(recently_used_recipes_by_day) > max_blocking_days:
                 recently_used_recipes_by_day = recently_used_recipes_by_day[
                     -max_blocking_days:
                 ]
 
-        # Move to the next day
-        current_date += timedelta(days=1)
-
-    print("   ✅ Meal plan generated successfully!")
+    logger.info("   ✅ Meal plan generated successfully!")
     return meal_plan, history_recently_used
 
 
@@ -839,31 +1588,33 @@ def format_meal_plan_as_markdown(
 
     # Add each day's meals
     for day_name, meals in meal_plan["week"].items():
-        lines.append(f"## {day_name}")
-        lines.append("")
+        lines.extend((f"## {day_name}", ""))
 
         # Add each meal type
-        for meal_type in ["breakfast", "lunch", "dinner"]:
-            if meal_type in meals:
-                meal = meals[meal_type]
-                lines.append(f"### {meal_type.title()}")
-                lines.append("")
-                lines.append(f"**{meal.get('title', 'No recipe')}**")
-
-                # Add extra details if available
-                if "Prep Time" in meal:
-                    lines.append(f"- Prep Time: {meal['Prep Time']}")
-                if "Cook Time" in meal:
-                    lines.append(f"- Cook Time: {meal['Cook Time']}")
-                if "Total Time" in meal:
-                    lines.append(f"- Total Time: {meal['Total Time']}")
-                if "note" in meal:
-                    lines.append(f"- *Note: {meal['note']}*")
+        for meal_type in MEAL_TYPES:
+            meal = meals.get(meal_type)
+            if meal is None:
+                continue
+
+            lines.extend(
+                (
+                    MEAL_TYPE_HEADINGS[meal_type],
+                    "",
+                    f"**{meal.get('title', 'No recipe')}**",
+                )
+            )
 
-                lines.append("")
+            # Add extra details if available
+            for field in MEAL_DETAIL_FIELDS:
+                value = meal.get(field)
+                if value is not None:
+                    lines.append(f"- {field}: {value}")
+            if "note" in meal:
+                lines.append(f"- *Note: {meal['note']}*")
 
-        lines.append("---")
-        lines.append("")
+            lines.append("")
+
+        lines.extend(("---", ""))
 
     # Add a footer with generation info
     lines.append("## Plan Information")
@@ -876,6 +1627,30 @@ def format_meal_plan_as_markdown(
     return "\n".join(lines)
 
 
+def write_text_atomically(path: Path, text: str) -> None:
+    """Save text to a file so readers never see a half-written file.
+
+    We write everything to a temporary file next to the real one first,
+    then swap it into place in one step. Anyone opening the file sees
+    either the old version or the complete new one.
+
+    Args:
+        path: Where to save the file
+        text: The text to save (written as UTF-8)
+
+    Example:
+        write_text_atomically(Path("plans/meal_plan_2026-01-20.md"), markdown)
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(text.encode("utf-8"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a stray temporary file behind if something went wrong
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def save_meal_plan(
     meal_plan: dict[str, Any],
     output_dir: Path,
@@ -906,10 +1681,9 @@ def save_meal_plan(
     # Convert to Markdown and save
     markdown_content = format_meal_plan_as_markdown(meal_plan, constraints, score)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(markdown_content)
+    write_text_atomically(output_path, markdown_content)
 
-    print(f"💾 Saved meal plan to {output_path}")
+    logger.info("💾 Saved meal plan to %s", output_path)
     return output_path
 
 
@@ -940,7 +1714,7 @@ def generate_and_save_grocery_list(
             print(f"Grocery list saved to {grocery_path}")
     """
     if not GROCERY_LIST_UTILS_AVAILABLE:
-        print("⚠️  Skipping grocery list generation (module not available)")
+        logger.warning("⚠️  Skipping grocery list generation (module not available)")
         return None
 
     # Extract all unique recipe filenames from the meal plan
@@ -956,10 +1730,10 @@ def generate_and_save_grocery_list(
                 recipe_names.append(recipe_name)
 
     if not recipe_names:
-        print("⚠️  No recipes found in meal plan - skipping grocery list")
+        logger.warning("⚠️  No recipes found in meal plan - skipping grocery list")
         return None
 
-    print(f"\n🛒 Generating grocery list from {len(recipe_names)} recipes...")
+    logger.info("\n🛒 Generating grocery list from %d recipes...", len(recipe_names))
 
     # Generate the grocery list
     grocery_list_content = generate_grocery_list_from_recipes(recipe_names, recipes_dir)
@@ -969,10 +1743,9 @@ def generate_and_save_grocery_list(
     grocery_path = output_dir / grocery_filename
 
     # Save the grocery list
-    with open(grocery_path, "w", encoding="utf-8") as f:
-        f.write(grocery_list_content)
+    write_text_atomically(grocery_path, grocery_list_content)
 
-    print(f"✅ Saved grocery list to {grocery_path}")
+    logger.info("✅ Saved grocery list to %s", grocery_path)
     return grocery_path
 
 
@@ -981,6 +1754,42 @@ def generate_and_save_grocery_list(
 # ==============================================================================
 
 
+def configure_logging() -> None:
+    """Set up how progress messages are shown.
+
+    Messages are printed to the screen as plain text (no timestamps), just
+    like print() would. Set the THC_LOGLEVEL environment variable to show
+    fewer messages, e.g. THC_LOGLEVEL=WARNING for warnings and errors only.
+
+    Libraries that log every request (see QUIET_LIBRARY_LOGGERS) only show
+    their warnings and errors, so they don't clutter the progress messages.
+    """
+    level = logging.getLevelName(os.environ.get(LOG_LEVEL_ENV_VAR, "INFO").upper())
+    if not isinstance(level, int):
+        level = logging.INFO  # Unknown level name - use the default
+    logging.basicConfig(level=level, format="%(message)s", stream=sys.stdout)
+    for library_logger_name in QUIET_LIBRARY_LOGGERS:
+        logging.getLogger(library_logger_name).setLevel(max(level, logging.WARNING))
+
+
+def report_missing_modules() -> None:
+    """Warn about optional helper modules that couldn't be imported.
+
+    The imports happen when the script is loaded, before logging is set up,
+    so the warnings wait until here to be shown like every other message.
+    """
+    if not HISTORY_UTILS_AVAILABLE:
+        logger.warning(
+            "⚠️  Warning: history_utils not available - history tracking disabled"
+        )
+    if not SCORING_UTILS_AVAILABLE:
+        logger.warning("⚠️  Warning: variety_scoring not available - scoring disabled")
+    if not GROCERY_LIST_UTILS_AVAILABLE:
+        logger.warning(
+            "⚠️  Warning: grocery_list_generator not available - grocery lists disabled"
+        )
+
+
 def main() -> None:
     """Main function that runs the meal plan generator.
 
@@ -989,15 +1798,17 @@ def main() -> None:
 
     When you run this script, this is the function that executes.
     """
-    print("=" * 70)
-    print("🍽️  THC Meal Prep Planner - Meal Plan Generator")
-    print("=" * 70)
-    print()
+    configure_logging()
+    report_missing_modules()
+
+    logger.info("=" * 70)
+    logger.info("🍽️  THC Meal Prep Planner - Meal Plan Generator")
+    logger.info("=" * 70)
+    logger.info("")
 
     # Display LLM status
     if LLM_UTILS_AVAILABLE:
-        print(get_llm_status_message())
-        print()
+        logger.info("%s\n", get_llm_status_message())
 
     # Figure out where all the files are
     # We use Path(__file__) to find where this script is located
@@ -1025,7 +1836,7 @@ def main() -> None:
         recipes = load_recipes(recipes_dir)
 
         if not recipes:
-            print(
+            logger.error(
                 "❌ Error: No recipes found! Please add recipe files to the recipes/ folder."
             )
             return
@@ -1035,21 +1846,39 @@ def main() -> None:
         constraints = load_constraints(constraints_path)
 
         # Step 4: Generate the meal plan (with history integration)
-        meal_plan, history_recently_used = generate_meal_plan(
-            profile, recipes, constraints, history_dir
-        )
+        history_recently_used = load_history_recently_used(constraints, history_dir)
+
+        # If nothing has changed since a previous run, reuse that run's plan.
+        # LLM suggestions can differ every time, so we never reuse plans
+        # when the LLM is switched on.
+        meal_plan = None
+        use_plan_cache = not (LLM_UTILS_AVAILABLE and is_llm_available())
+        if use_plan_cache:
+            plan_cache_key = compute_plan_cache_key(
+                profile, recipes, constraints, history_recently_used
+            )
+            meal_plan = load_cached_meal_plan(plan_cache_key)
+            if meal_plan is not None:
+                logger.info("\n♻️  Inputs unchanged - reusing cached meal plan")
+
+        if meal_plan is None:
+            meal_plan, history_recently_used = generate_meal_plan(
+                profile, recipes, constraints, history_dir, history_recently_used
+            )
+            if use_plan_cache:
+                save_cached_meal_plan(plan_cache_key, meal_plan)
 
         # Step 5: Calculate variety score if enabled
         score = None
         if SCORING_UTILS_AVAILABLE:
             scoring_config = constraints.get("scoring", {})
             if scoring_config.get("enabled", False):
-                print("\n📊 Calculating variety score...")
+                logger.info("\n📊 Calculating variety score...")
                 # Use the history list returned from generation (no duplicate loading)
                 score = calculate_meal_plan_score(
                     meal_plan, constraints, history_recently_used
                 )
-                print(f"   Score: {score['total_score']} ({score['grade']})")
+                logger.info("   Score: %s (%s)", score["total_score"], score["grade"])
 
         # Step 6: Save the meal plan
         output_path = save_meal_plan(meal_plan, plans_dir, constraints, score)
@@ -1065,44 +1894,48 @@ def main() -> None:
             if history_config.get("enabled", False) and history_config.get(
                 "auto_save", False
             ):
-                print("\n💾 Saving to history...")
+                logger.info("\n💾 Saving to history...")
                 ttl_days = history_config.get("ttl_days", 30)
                 history_path = save_plan_to_history(meal_plan, history_dir, ttl_days)
-                print(f"   Saved history to {history_path}")
+                logger.info("   Saved history to %s", history_path)
 
         # Success! Tell the user what happened
-        print()
-        print("=" * 70)
-        print("✨ Success! Your meal plan is ready!")
-        print("=" * 70)
-        print()
-        print(f"📄 View your meal plan: {output_path}")
+        logger.info("")
+        logger.info("=" * 70)
+        logger.info("✨ Success! Your meal plan is ready!")
+        logger.info("=" * 70)
+        logger.info("")
+        logger.info("📄 View your meal plan: %s", output_path)
         if grocery_list_path:
-            print(f"🛒 View your grocery list: {grocery_list_path}")
-        print()
-        print("Next steps:")
-        print("  1. Open the meal plan file to see your weekly schedule")
+            logger.info("🛒 View your grocery list: %s", grocery_list_path)
+        logger.info("")
+        logger.info("Next steps:")
+        logger.info("  1. Open the meal plan file to see your weekly schedule")
         if grocery_list_path:
-            print("  2. Use the grocery list for your shopping trip")
-            print("  3. Add more recipes to the recipes/ folder for more variety")
-            print("  4. Try creating a different profile in profiles/")
-            print("  5. Adjust constraints in constraints/sample_constraints.yaml")
+            logger.info("  2. Use the grocery list for your shopping trip")
+            logger.info("  3. Add more recipes to the recipes/ folder for more variety")
+            logger.info("  4. Try creating a different profile in profiles/")
+            logger.info(
+                "  5. Adjust constraints in constraints/sample_constraints.yaml"
+            )
         else:
-            print("  2. Add more recipes to the recipes/ folder for more variety")
-            print("  3. Try creating a different profile in profiles/")
-            print("  4. Adjust constraints in constraints/sample_constraints.yaml")
-        print()
+            logger.info("  2. Add more recipes to the recipes/ folder for more variety")
+            logger.info("  3. Try creating a different profile in profiles/")
+            logger.info(
+                "  4. Adjust constraints in constraints/sample_constraints.yaml"
+            )
+        logger.info("")
 
     except FileNotFoundError as e:
-        print(f"❌ Error: Could not find required file: {e}")
-        print("   Make sure all necessary files exist in their folders.")
+        logger.error("❌ Error: Could not find required file: %s", e)
+        logger.error("   Make sure all necessary files exist in their folders.")
     except yaml.YAMLError as e:
-        print("❌ Error: There is a problem with your YAML configuration file.")
-        print(f"   Details: {e}")
-        print("   Please check the formatting of your YAML constraints file.")
+        logger.error("❌ Error: There is a problem with your YAML configuration file.")
+        logger.error("   Details: %s", e)
+        logger.error("   Please check the formatting of your YAML constraints file.")
     except Exception as e:
-        print(f"❌ Error: Something went wrong: {e}")
-        print("   Please check your input files and try again.")
+        logger.error("❌ Error: Something went wrong: %s", e)
+        logger.error("   Please check your input files and try again.")
 
 
 # ==============================================================================
@@ -24,10 +24,17 @@ Author: THC Meal Prep Planner Team
 Created: 2026-01-18
 """
 
+import logging
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from fractions import Fraction
+from math import gcd
+
+logger = logging.getLogger(__name__)
 
 # ==============================================================================
 # CATEGORY DEFINITIONS - Grocery store sections for ingredient organization
@@ -177,11 +184,127 @@ CATEGORY_KEYWORDS: Dict[str, List[str]] = {
 }
 
 
+# Below this many recipes we just read them one at a time
+# Starting worker threads costs more than it saves for a handful of small files
+MIN_RECIPES_FOR_PARALLEL_LOAD = 8
+
+# How many different ingredient names, units and quantities to remember the
+# cleaned-up results for. The same few ("salt", "olive oil", "cup", "1")
+# show up in almost every recipe, so remembering them saves redoing the
+# pattern matching each time.
+INGREDIENT_CACHE_SIZE = 4096
+
+# Order in which categories are checked when sorting an ingredient
+# Order matters! More specific categories should be checked first
+CATEGORY_PRIORITY_ORDER: Tuple[str, ...] = (
+    "Bakery",
+    "Meat",
+    "Dairy",
+    "Frozen",
+    "Pantry",
+    "Produce",
+)
+
+
+def build_category_matchers(
+    category_keywords: Dict[str, List[str]],
+) -> Tuple[Tuple[str, Tuple[str, ...], Optional["re.Pattern[str]"]], ...]:
+    """Turn the category keyword lists into ready-to-use matchers.
+
+    Checking every keyword one at a time means building and running a
+    separate pattern for each keyword (and its plurals) for every ingredient.
+    Instead, each category gets:
+    - a tuple of its multi-word keywords (matched as plain substrings)
+    - one compiled pattern matching any of its single-word keywords as a
+      whole word, including simple plurals ("egg" -> "eggs", "tomato" ->
+      "tomatoes") for keywords that don't already end in "s"
+
+    Args:
+        category_keywords: Mapping of category name to its keywords
+
+    Returns:
+        Tuple of (category, multi_word_keywords, single_word_pattern) in
+        CATEGORY_PRIORITY_ORDER. single_word_pattern is None if the category
+        has no single-word keywords.
+
+    Examples:
+        >>> matchers = build_category_matchers({"Dairy": ["egg", "sour cream"]})
+        >>> matchers[0][1]
+        ('sour cream',)
+        >>> bool(matchers[0][2].search("2 eggs"))
+        True
+    """
+    matchers = []
+    for category in CATEGORY_PRIORITY_ORDER:
+        if category not in category_keywords:
+            continue
+        multi_word = []
+        single_word = []
+        for keyword in category_keywords[category]:
+            if " " in keyword:
+                multi_word.append(keyword)
+            elif keyword.endswith("s"):
+                single_word.append(re.escape(keyword))
+            else:
+                single_word.append(re.escape(keyword) + "(?:s|es)?")
+        pattern = (
+            re.compile(r"\b(?:" + "|".join(single_word) + r")\b")
+            if single_word
+            else None
+        )
+        matchers.append((category, tuple(multi_word), pattern))
+    return tuple(matchers)
+
+
+# Matchers for categorize_ingredient, built once from CATEGORY_KEYWORDS
+# (rebuild with build_category_matchers if you change the keywords)
+CATEGORY_MATCHERS = build_category_matchers(CATEGORY_KEYWORDS)
+
+
 # ==============================================================================
 # INGREDIENT PARSING - Extract and normalize ingredient information
 # ==============================================================================
 
+# Patterns used to clean up ingredient names, compiled once so cleaning each
+# ingredient doesn't have to look them up again (applied in this order)
+
+# Parenthetical notes like "(optional)" or "(about 1/2 cup)"
+PARENTHETICAL_PATTERN = re.compile(r"\([^)]*\)")
+
+# Common descriptors after commas, like ", diced" or ", for serving"
+TRAILING_DESCRIPTOR_PATTERN = re.compile(
+    r",\s*(diced|chopped|sliced|minced|halved|thinly sliced|optional|for serving|for garnish|for topping|for the topping|drained and rinsed|cubed|crumbled|shredded|grated).*$",
+    re.IGNORECASE,
+)
+
+# Trailing "for X" phrases without commas (e.g., "green onions for garnish")
+TRAILING_FOR_PATTERN = re.compile(
+    r"\s+for\s+(serving|garnish|topping|the topping)\b.*$", re.IGNORECASE
+)
+
+# "pinch of" and similar quantity qualifiers that become part of the name
+AMOUNT_QUALIFIER_PATTERN = re.compile(r"^(pinch of|dash of|hint of)\s+", re.IGNORECASE)
+
+# "to taste" phrases
+TO_TASTE_PATTERN = re.compile(r"\s+to taste.*$", re.IGNORECASE)
+
+# "or X" alternatives (e.g., "honey or maple syrup")
+ALTERNATIVE_PATTERN = re.compile(r"\s+or\s+.+$", re.IGNORECASE)
 
+# "and X" where X is a single word at the end (e.g., "salt and pepper")
+TRAILING_AND_WORD_PATTERN = re.compile(r"\s+and\s+\w+\s*$", re.IGNORECASE)
+
+# "juice of X" format (e.g., "juice of 1 lime")
+JUICE_OF_PATTERN = re.compile(r"juice of \d+\s+(.+)", re.IGNORECASE)
+
+# Qualifier words at the beginning (fresh, dried, etc.)
+LEADING_QUALIFIER_PATTERN = re.compile(
+    r"^(fresh|dried|frozen|canned|shredded|chopped|sliced|diced|minced|block|firm|extra|extra-virgin|raw|cooked)\s+",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=INGREDIENT_CACHE_SIZE)
 def clean_ingredient_name(name: str) -> str:
     """Clean ingredient name by removing parenthetical notes and extra details.
 
@@ -201,51 +324,36 @@ def clean_ingredient_name(name: str) -> str:
         'cilantro'
     """
     # Remove parenthetical notes
-    name = re.sub(r"\([^)]*\)", "", name)
+    name = PARENTHETICAL_PATTERN.sub("", name)
 
     # Remove common descriptors after commas
-    name = re.sub(
-        r",\s*(diced|chopped|sliced|minced|halved|thinly sliced|optional|for serving|for garnish|for topping|for the topping|drained and rinsed|cubed|crumbled|shredded|grated).*$",
-        "",
-        name,
-        flags=re.IGNORECASE,
-    )
+    name = TRAILING_DESCRIPTOR_PATTERN.sub("", name)
 
     # Remove trailing "for X" phrases without commas (e.g., "green onions for garnish")
-    name = re.sub(
-        r"\s+for\s+(serving|garnish|topping|the topping)\b.*$",
-        "",
-        name,
-        flags=re.IGNORECASE,
-    )
+    name = TRAILING_FOR_PATTERN.sub("", name)
 
     # Remove "pinch of" and similar quantity qualifiers that become part of the name
-    name = re.sub(r"^(pinch of|dash of|hint of)\s+", "", name, flags=re.IGNORECASE)
+    name = AMOUNT_QUALIFIER_PATTERN.sub("", name)
 
     # Remove "to taste" phrases
-    name = re.sub(r"\s+to taste.*$", "", name, flags=re.IGNORECASE)
+    name = TO_TASTE_PATTERN.sub("", name)
 
     # Remove "or X" alternatives to allow merging (e.g., "honey or maple syrup" -> "honey")
-    name = re.sub(r"\s+or\s+.+$", "", name, flags=re.IGNORECASE)
+    name = ALTERNATIVE_PATTERN.sub("", name)
 
     # Remove "and X" where X is a single word at the end (e.g., "salt and pepper" -> "salt")
     # This helps consolidate seasoning combinations
     # Only apply if it's a simple "and word" pattern at the end
-    name = re.sub(r"\s+and\s+\w+\s*$", "", name, flags=re.IGNORECASE)
+    name = TRAILING_AND_WORD_PATTERN.sub("", name)
 
     # Handle "juice of X" format - extract just the citrus
-    juice_match = re.match(r"juice of \d+\s+(.+)", name, flags=re.IGNORECASE)
+    juice_match = JUICE_OF_PATTERN.match(name)
     if juice_match:
         # Convert "juice of 1 lime" to "lime juice"
         return juice_match.group(1) + " juice"
 
     # Remove qualifier words at the beginning (fresh, dried, etc.)
-    name = re.sub(
-        r"^(fresh|dried|frozen|canned|shredded|chopped|sliced|diced|minced|block|firm|extra|extra-virgin|raw|cooked)\s+",
-        "",
-        name,
-        flags=re.IGNORECASE,
-    )
+    name = LEADING_QUALIFIER_PATTERN.sub("", name)
 
     # Clean up extra whitespace
     name = " ".join(name.split())
@@ -253,42 +361,9 @@ def clean_ingredient_name(name: str) -> str:
     return name.strip()
 
 
-def parse_ingredient_line(line: str) -> Optional[Tuple[str, str, str]]:
-    """Parse an ingredient line to extract quantity, unit, and name.
-
-    This function handles various ingredient formats commonly found in recipes:
-    - "2 cups flour"
-    - "1/2 teaspoon salt"
-    - "3-4 tablespoons olive oil"
-    - "8 large eggs"
-    - "Salt and pepper to taste"
-
-    Args:
-        line: A single ingredient line from a recipe (e.g., "2 cups flour")
-
-    Returns:
-        A tuple of (quantity, unit, ingredient_name) or None if parsing fails.
-        - quantity: String representation of amount (e.g., "2", "1/2", "3-4")
-        - unit: Unit of measurement (e.g., "cups", "tsp") or "" if none
-        - ingredient_name: Name of ingredient (e.g., "flour", "salt")
-
-    Examples:
-        >>> parse_ingredient_line("2 cups flour")
-        ('2', 'cups', 'flour')
-        >>> parse_ingredient_line("1/2 teaspoon salt")
-        ('1/2', 'teaspoon', 'salt')
-        >>> parse_ingredient_line("Salt to taste")
-        ('1', '', 'salt')
-    """
-    # Remove leading bullets, dashes, and whitespace
-    line = re.sub(r"^[-•*]\s*", "", line.strip())
-
-    # Skip empty lines or section headers
-    if not line or line.startswith("#"):
-        return None
-
-    # Common measurement units - check if present to distinguish from ingredient names
-    common_units = {
+# Common measurement units - check if present to distinguish from ingredient names
+COMMON_UNITS = frozenset(
+    {
         "tbsp",
         "tbs",
         "tb",
@@ -332,11 +407,60 @@ def parse_ingredient_line(line: str) -> Optional[Tuple[str, str, str]]:
         "cloves",
         "count",
     }
+)
+
+# Leading bullets, dashes, and whitespace on an ingredient line
+INGREDIENT_BULLET_PATTERN = re.compile(r"^[-•*]\s*")
+
+# An ingredient line that starts with a quantity, like "2 cups flour" or
+# "1 to 2 tsp salt": (quantity, word after it, rest of the line)
+QUANTITY_LINE_PATTERN = re.compile(
+    r"^([\d./\-]+(?:\s+to\s+[\d./\-]+)?)\s+(\S+)\s+(.+)$"
+)
+
+
+def parse_ingredient_line(line: str) -> Optional[Tuple[str, str, str]]:
+    """Parse an ingredient line to extract quantity, unit, and name.
+
+    This function handles various ingredient formats commonly found in recipes:
+    - "2 cups flour"
+    - "1/2 teaspoon salt"
+    - "3-4 tablespoons olive oil"
+    - "8 large eggs"
+    - "Salt and pepper to taste"
+
+    Args:
+        line: A single ingredient line from a recipe (e.g., "2 cups flour")
+
+    Returns:
+        A tuple of (quantity, unit, ingredient_name) or None if parsing fails.
+        - quantity: String representation of amount (e.g., "2", "1/2", "3-4")
+        - unit: Unit of measurement (e.g., "cups", "tsp") or "" if none
+        - ingredient_name: Name of ingredient (e.g., "flour", "salt")
+
+    Examples:
+        >>> parse_ingredient_line("2 cups flour")
+        ('2', 'cups', 'flour')
+        >>> parse_ingredient_line("1/2 teaspoon salt")
+        ('1/2', 'teaspoon', 'salt')
+        >>> parse_ingredient_line("Salt to taste")
+        ('1', '', 'salt')
+    """
+    # Remove leading bullets, dashes, and whitespace
+    line = INGREDIENT_BULLET_PATTERN.sub("", line.strip())
+
+    # Skip empty lines or section headers
+    if not line or line.startswith("#"):
+        return None
 
     # Try pattern with explicit unit first
     # Matches: "2 cups flour" or "1/2 tsp salt"
-    pattern_with_unit = r"^([\d./\-]+(?:\s+to\s+[\d./\-]+)?)\s+(\S+)\s+(.+)$"
-    match = re.match(pattern_with_unit, line)
+    # Only lines starting with a number (or ".", "/", "-") can match, so
+    # skip the pattern for everything else
+    first_char = line[0]
+    match = None
+    if first_char.isdecimal() or first_char in "./-":
+        match = QUANTITY_LINE_PATTERN.match(line)
 
     if match:
         quantity = match.group(1).strip()
@@ -344,7 +468,7 @@ def parse_ingredient_line(line: str) -> Optional[Tuple[str, str, str]]:
         potential_name = match.group(3).strip()
 
         # Check if the second word is actually a measurement unit
-        if potential_unit.lower() in common_units:
+        if potential_unit.lower() in COMMON_UNITS:
             # It's a unit! Clean and return
             name = clean_ingredient_name(potential_name)
             return (quantity, potential_unit, name)
@@ -359,6 +483,54 @@ def parse_ingredient_line(line: str) -> Optional[Tuple[str, str, str]]:
     return ("1", "", cleaned_name)
 
 
+# Unit spellings mapped to their standard form, so normalize_unit is a
+# single lookup. Keys are lowercase since we normalize via .lower() first.
+UNIT_ALIASES: Dict[str, str] = {
+    # Tablespoon variations
+    "tbsp": "tablespoon",
+    "tbs": "tablespoon",
+    "tb": "tablespoon",
+    "tablespoon": "tablespoon",
+    "tablespoons": "tablespoon",
+    # Teaspoon variations
+    # Note: 't' is intentionally omitted as it's too ambiguous
+    "tsp": "teaspoon",
+    "ts": "teaspoon",
+    "teaspoon": "teaspoon",
+    "teaspoons": "teaspoon",
+    # Cup variations
+    "c": "cup",
+    "cup": "cup",
+    "cups": "cup",
+    # Ounce variations
+    "oz": "ounce",
+    "ounce": "ounce",
+    "ounces": "ounce",
+    # Pound variations
+    "lb": "pound",
+    "lbs": "pound",
+    "pound": "pound",
+    "pounds": "pound",
+    # Gram variations
+    "g": "gram",
+    "gram": "gram",
+    "grams": "gram",
+    # Can variations
+    "can": "can",
+    "cans": "can",
+    # Clove variations (important for garlic merging)
+    "clove": "clove",
+    "cloves": "clove",
+    # Count-based (for eggs, items, etc.) - empty string to merge better
+    "large": "",
+    "medium": "",
+    "small": "",
+    "whole": "",
+    "count": "",
+}
+
+
+@lru_cache(maxsize=INGREDIENT_CACHE_SIZE)
 def normalize_unit(unit: str) -> str:
     """Normalize unit abbreviations to standard forms.
 
@@ -384,48 +556,47 @@ def normalize_unit(unit: str) -> str:
     """
     unit_lower = unit.lower()
 
-    # Tablespoon variations
-    # Note: Including just lowercase since we normalize via .lower() above
-    if unit_lower in ["tbsp", "tbs", "tb", "tablespoon", "tablespoons"]:
-        return "tablespoon"
+    # Look up the standard form; return as-is if no normalization needed
+    return UNIT_ALIASES.get(unit_lower, unit_lower)
 
-    # Teaspoon variations
-    # Note: 't' is intentionally omitted as it's too ambiguous
-    if unit_lower in ["tsp", "ts", "teaspoon", "teaspoons"]:
-        return "teaspoon"
 
-    # Cup variations
-    if unit_lower in ["c", "cup", "cups"]:
-        return "cup"
+def quantity_to_float(text: str) -> float:
+    """Convert a single quantity like "2", "1/2" or "1.5" to a number.
 
-    # Ounce variations
-    if unit_lower in ["oz", "ounce", "ounces"]:
-        return "ounce"
+    Whole numbers and simple "N/M" fractions are by far the most common
+    quantities, so we handle them directly. Anything else goes through
+    Fraction, which understands decimals and signs too but is much slower.
 
-    # Pound variations
-    if unit_lower in ["lb", "lbs", "pound", "pounds"]:
-        return "pound"
+    Args:
+        text: One quantity with no surrounding whitespace (e.g., "3", "3/4")
 
-    # Gram variations
-    if unit_lower in ["g", "gram", "grams"]:
-        return "gram"
+    Returns:
+        Numeric value as float
 
-    # Can variations
-    if unit_lower in ["can", "cans"]:
-        return "can"
+    Raises:
+        ValueError: If the text isn't a number
+        ZeroDivisionError: If a fraction has a zero denominator
 
-    # Clove variations (important for garlic merging)
-    if unit_lower in ["clove", "cloves"]:
-        return "clove"
+    Examples:
+        >>> quantity_to_float("3")
+        3.0
+        >>> quantity_to_float("3/4")
+        0.75
+        >>> quantity_to_float("1.5")
+        1.5
+    """
+    if text.isdecimal():
+        return float(text)
 
-    # Count-based (for eggs, items, etc.) - return empty string to merge better
-    if unit_lower in ["large", "medium", "small", "whole", "count"]:
-        return ""
+    numerator, slash, denominator = text.partition("/")
+    if slash and numerator.isdecimal() and denominator.isdecimal():
+        # Dividing two ints gives the same correctly rounded float as Fraction
+        return int(numerator) / int(denominator)
 
-    # Return as-is if no normalization needed
-    return unit_lower if unit_lower else ""
+    return float(Fraction(text))
 
 
+@lru_cache(maxsize=INGREDIENT_CACHE_SIZE)
 def parse_quantity_range(quantity_str: str) -> float:
     """Parse a quantity string to a numeric value.
 
@@ -453,8 +624,8 @@ def parse_quantity_range(quantity_str: str) -> float:
         parts = quantity_str.split("-")
         if len(parts) == 2:
             try:
-                low = float(Fraction(parts[0].strip()))
-                high = float(Fraction(parts[1].strip()))
+                low = quantity_to_float(parts[0].strip())
+                high = quantity_to_float(parts[1].strip())
                 return (low + high) / 2
             except (ValueError, ZeroDivisionError):
                 return 1.0
@@ -464,19 +635,20 @@ def parse_quantity_range(quantity_str: str) -> float:
         parts = re.split(r"\s+to\s+", quantity_str.lower())
         if len(parts) == 2:
             try:
-                low = float(Fraction(parts[0].strip()))
-                high = float(Fraction(parts[1].strip()))
+                low = quantity_to_float(parts[0].strip())
+                high = quantity_to_float(parts[1].strip())
                 return (low + high) / 2
             except (ValueError, ZeroDivisionError):
                 return 1.0
 
     # Handle fractions and decimals
     try:
-        return float(Fraction(quantity_str))
+        return quantity_to_float(quantity_str)
     except (ValueError, ZeroDivisionError):
         return 1.0
 
 
+@lru_cache(maxsize=INGREDIENT_CACHE_SIZE)
 def categorize_ingredient(ingredient_name: str) -> str:
     """Categorize an ingredient into a grocery store section.
 
@@ -518,37 +690,18 @@ def categorize_ingredient(ingredient_name: str) -> str:
     ingredient_lower = ingredient_name.lower()
 
     # Check categories in priority order to avoid ambiguous matches
-    # Order matters! More specific categories should be checked first
-    priority_order = ["Bakery", "Meat", "Dairy", "Frozen", "Pantry", "Produce"]
-
-    for category in priority_order:
-        if category in CATEGORY_KEYWORDS:
-            keywords = CATEGORY_KEYWORDS[category]
-            for keyword in keywords:
-                # For multi-word keywords (containing spaces), use substring matching
-                if " " in keyword:
-                    if keyword in ingredient_lower:
-                        return category
-                else:
-                    # For single-word keywords, use word boundary matching with plural support
-                    # This prevents "pea" from matching "black-eyed peas"
-                    # but allows "egg" to match "eggs" and "tomato" to match "tomatoes"
-
-                    # Try exact match first
-                    pattern = r"\b" + re.escape(keyword) + r"\b"
-                    if re.search(pattern, ingredient_lower):
-                        return category
-
-                    # Try with common plural forms (add 's', 'es')
-                    # Only for keywords that don't already end in 's'
-                    if not keyword.endswith("s"):
-                        plural_patterns = [
-                            r"\b" + re.escape(keyword) + r"s\b",  # egg -> eggs
-                            r"\b" + re.escape(keyword) + r"es\b",  # tomato -> tomatoes
-                        ]
-                        for plural_pattern in plural_patterns:
-                            if re.search(plural_pattern, ingredient_lower):
-                                return category
+    # (see CATEGORY_PRIORITY_ORDER and build_category_matchers)
+    for category, multi_word_keywords, single_word_pattern in CATEGORY_MATCHERS:
+        # For multi-word keywords (containing spaces), use substring matching
+        for keyword in multi_word_keywords:
+            if keyword in ingredient_lower:
+                return category
+
+        # For single-word keywords, use word boundary matching with plural
+        # support. This prevents "pea" from matching "black-eyed peas"
+        # but allows "egg" to match "eggs" and "tomato" to match "tomatoes"
+        if single_word_pattern and single_word_pattern.search(ingredient_lower):
+            return category
 
     # Default to "Other" if no category match found
     return "Other"
@@ -579,59 +732,120 @@ def load_recipe_ingredients(recipe_path: Path) -> List[Tuple[str, str, str]]:
         >>> len(ingredients) > 0
         True
     """
-    if not recipe_path.exists():
-        raise FileNotFoundError(f"Recipe file not found: {recipe_path}")
+    # Just try to read it - checking exists() first would only add a second
+    # trip to the disk (and the file could still vanish in between)
+    try:
+        content = recipe_path.read_text(encoding="utf-8")
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"Recipe file not found: {recipe_path}") from exc
 
     ingredients: List[Tuple[str, str, str]] = []
-    in_ingredients_section = False
-
-    with open(recipe_path, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-
-            # Check if we're entering the Ingredients section
-            if line.startswith("## Ingredients"):
-                in_ingredients_section = True
-                continue
-
-            # Check if we've left the Ingredients section (next ## header)
-            if (
-                in_ingredients_section
-                and line.startswith("## ")
-                and "Ingredients" not in line
-            ):
-                break
-
-            # Skip subsection headers (### For the Filling, etc.)
-            if in_ingredients_section and line.startswith("###"):
-                continue
-
-            # Parse ingredient lines (start with - or *)
-            if in_ingredients_section and (
-                line.startswith("-") or line.startswith("*")
-            ):
-                parsed = parse_ingredient_line(line)
-                if parsed:
-                    ingredients.append(parsed)
+
+    # Jump straight to the "## Ingredients" heading instead of checking every
+    # line before it. The heading must start its line (leading spaces are ok).
+    section_start = content.find("## Ingredients")
+    while section_start != -1:
+        line_start = content.rfind("\n", 0, section_start) + 1
+        if not content[line_start:section_start].strip():
+            break
+        section_start = content.find("## Ingredients", section_start + 1)
+    if section_start == -1:
+        return ingredients
+
+    # Go through the lines after the heading
+    for line in content[section_start:].split("\n")[1:]:
+        line = line.strip()
+
+        # Another "## Ingredients..." heading continues the section
+        if line.startswith("## Ingredients"):
+            continue
+
+        # Check if we've left the Ingredients section (next ## header)
+        if line.startswith("## ") and "Ingredients" not in line:
+            break
+
+        # Skip subsection headers (### For the Filling, etc.)
+        if line.startswith("###"):
+            continue
+
+        # Parse ingredient lines (start with - or *)
+        if line.startswith("-") or line.startswith("*"):
+            parsed = parse_ingredient_line(line)
+            if parsed:
+                ingredients.append(parsed)
 
     return ingredients
 
 
+def load_recipe_ingredients_if_found(
+    recipe_path: Path,
+) -> Optional[List[Tuple[str, str, str]]]:
+    """Load ingredients from a recipe file, or None if the file doesn't exist.
+
+    Like load_recipe_ingredients, but a missing file is reported by returning
+    None instead of raising, so many recipes can be loaded side by side and
+    the missing ones reported afterwards in order.
+
+    Args:
+        recipe_path: Path to the recipe markdown file
+
+    Returns:
+        List of tuples (quantity, unit, ingredient_name), or None if the
+        recipe file doesn't exist
+
+    Examples:
+        >>> load_recipe_ingredients_if_found(Path("recipes/no-such-recipe.md")) is None
+        True
+    """
+    try:
+        return load_recipe_ingredients(recipe_path)
+    except FileNotFoundError:
+        return None
+
+
 # ==============================================================================
 # GROCERY LIST GENERATION - Merge, quantify, and organize ingredients
 # ==============================================================================
 
 
+@lru_cache(maxsize=INGREDIENT_CACHE_SIZE)
+def normalize_ingredient_name(name: str) -> str:
+    """Lowercase an ingredient name and collapse its whitespace for merging.
+
+    Names from parse_ingredient_line are already tidy, but merge_ingredients
+    accepts names from anywhere, so we still normalize them. The same names
+    come up again and again, so the results are remembered.
+
+    Args:
+        name: Ingredient name (e.g., "Olive  Oil")
+
+    Returns:
+        Normalized name (e.g., "olive oil")
+
+    Examples:
+        >>> normalize_ingredient_name("  Olive   Oil ")
+        'olive oil'
+    """
+    return " ".join(name.lower().split())
+
+
 def merge_ingredients(
     all_ingredients: List[Tuple[str, str, str]],
+    merged: Optional[Dict[str, Dict[str, float]]] = None,
 ) -> Dict[str, Dict[str, float]]:
     """Merge and quantify duplicate ingredients across recipes.
 
     Combines ingredients with the same name and unit, summing their quantities.
     For example, "2 cups flour" + "1 cup flour" = "3 cups flour".
 
+    Pass in the result of an earlier call as merged to keep adding to it, so
+    recipes can be merged one at a time without first collecting every
+    ingredient into one big list.
+
     Args:
         all_ingredients: List of (quantity, unit, name) tuples from all recipes
+        merged: Optional dictionary from an earlier call to add to (updated
+                in place). If not given, a new dictionary is started.
 
     Returns:
         Dictionary mapping ingredient names to {unit: total_quantity} dicts
@@ -641,12 +855,16 @@ def merge_ingredients(
         >>> merged = merge_ingredients(ingredients)
         >>> merged["flour"]["cup"]
         3.0
+        >>> merged = merge_ingredients([("1/2", "cup", "flour")], merged)
+        >>> merged["flour"]["cup"]
+        3.5
     """
-    merged: Dict[str, Dict[str, float]] = {}
+    if merged is None:
+        merged = {}
 
     for quantity_str, unit, name in all_ingredients:
         # Normalize the ingredient name (lowercase, strip extra whitespace)
-        name_clean = " ".join(name.lower().split())
+        name_clean = normalize_ingredient_name(name)
 
         # Normalize the unit
         unit_norm = normalize_unit(unit)
@@ -654,15 +872,10 @@ def merge_ingredients(
         # Parse quantity to numeric value
         quantity = parse_quantity_range(quantity_str)
 
-        # Initialize ingredient entry if not exists
-        if name_clean not in merged:
-            merged[name_clean] = {}
-
-        # Add or update quantity for this unit
-        if unit_norm not in merged[name_clean]:
-            merged[name_clean][unit_norm] = 0.0
-
-        merged[name_clean][unit_norm] += quantity
+        # Add to the running total for this name and unit
+        # (starting both the ingredient entry and the total if they're new)
+        units = merged.setdefault(name_clean, {})
+        units[unit_norm] = units.get(unit_norm, 0.0) + quantity
 
     return merged
 
@@ -691,24 +904,34 @@ def format_quantity(quantity: float) -> str:
     if quantity == int(quantity):
         return str(int(quantity))
 
-    # Try to convert to fraction for common values
-    frac = Fraction(quantity).limit_denominator(16)
-
-    # If the fraction is a good representation, use it
-    if abs(float(frac) - quantity) < 0.01:
-        if frac.numerator > frac.denominator:
-            # Mixed number (e.g., 2 1/2)
-            whole = frac.numerator // frac.denominator
-            remainder = frac.numerator % frac.denominator
-            if remainder == 0:
-                return str(whole)
-            return f"{whole} {remainder}/{frac.denominator}"
-        else:
-            # Simple fraction (e.g., 1/2)
-            return f"{frac.numerator}/{frac.denominator}"
-
-    # Fall back to decimal with one decimal place
-    return f"{quantity:.1f}"
+    # Halves, quarters, eighths and sixteenths (by far the most common in
+    # recipes) are stored exactly, so we can read the fraction straight off.
+    # Anything else (like thirds) needs Fraction to find the closest match.
+    sixteenths = quantity * 16
+    if sixteenths.is_integer():
+        divisor = gcd(int(sixteenths), 16)
+        numerator = int(sixteenths) // divisor
+        denominator = 16 // divisor
+    else:
+        frac = Fraction(quantity).limit_denominator(16)
+
+        # If the fraction isn't a good representation, fall back to decimal
+        # with one decimal place
+        if abs(float(frac) - quantity) >= 0.01:
+            return f"{quantity:.1f}"
+        numerator = frac.numerator
+        denominator = frac.denominator
+
+    if numerator > denominator:
+        # Mixed number (e.g., 2 1/2)
+        whole = numerator // denominator
+        remainder = numerator % denominator
+        if remainder == 0:
+            return str(whole)
+        return f"{whole} {remainder}/{denominator}"
+
+    # Simple fraction (e.g., 1/2)
+    return f"{numerator}/{denominator}"
 
 
 def pluralize_unit(unit: str, quantity: float) -> str:
@@ -891,28 +1114,47 @@ def generate_grocery_list_from_recipes(
         >>> "## Produce" in grocery_list
         True
     """
-    all_ingredients: List[Tuple[str, str, str]] = []
-
-    # Load ingredients from all recipes
-    for recipe_name in recipe_names:
-        # Handle both with and without .md extension
-        recipe_filename = (
-            recipe_name if recipe_name.endswith(".md") else f"{recipe_name}.md"
-        )
-        recipe_path = recipes_dir / recipe_filename
+    merged: Dict[str, Dict[str, float]] = {}
 
-        try:
-            ingredients = load_recipe_ingredients(recipe_path)
-            all_ingredients.extend(ingredients)
-        except FileNotFoundError:
-            print(f"Warning: Recipe file not found: {recipe_path}")
+    # Work out each recipe's file (handle both with and without .md extension)
+    recipe_paths = [
+        recipes_dir
+        / (recipe_name if recipe_name.endswith(".md") else f"{recipe_name}.md")
+        for recipe_name in recipe_names
+    ]
+
+    # Load ingredients from all recipes - for a long list, read several files
+    # at the same time since much of the work is waiting on the disk
+    if len(recipe_paths) < MIN_RECIPES_FOR_PARALLEL_LOAD:
+        loaded = [load_recipe_ingredients_if_found(path) for path in recipe_paths]
+    else:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            loaded = list(executor.map(load_recipe_ingredients_if_found, recipe_paths))
+
+    # Combine them in recipe order, noting any that were missing
+    # (merging straight into one dictionary, without building a list of
+    # every ingredient first)
+    missing_paths = []
+    for recipe_path, ingredients in zip(recipe_paths, loaded):
+        if ingredients is None:
+            missing_paths.append(recipe_path)
             continue
 
-    if not all_ingredients:
-        return "# Grocery List\n\nNo ingredients found in the specified recipes.\n"
+        # Merge duplicate ingredients as we go
+        merge_ingredients(ingredients, merged)
 
-    # Merge duplicate ingredients
-    merged = merge_ingredients(all_ingredients)
+    # Warn about all the missing recipes at once
+    if missing_paths:
+        logger.warning(
+            "\n".join(
+                f"Warning: Recipe file not found: {recipe_path}"
+                for recipe_path in missing_paths
+            )
+        )
+
+    if not merged:
+        return "# Grocery List\n\nNo ingredients found in the specified recipes.\n"
 
     # Categorize ingredients
     categorized: Dict[str, List[Tuple[str, str, float]]] = {
@@ -925,16 +1167,14 @@ def generate_grocery_list_from_recipes(
         "Other": [],
     }
 
-    for ingredient_name, units_dict in merged.items():
+    # Going through the names in alphabetical order means every category's
+    # list comes out already sorted, with no need to sort each one afterwards
+    for ingredient_name in sorted(merged):
         category = categorize_ingredient(ingredient_name)
 
-        for unit, quantity in units_dict.items():
+        for unit, quantity in merged[ingredient_name].items():
             categorized[category].append((ingredient_name, unit, quantity))
 
-    # Sort ingredients within each category alphabetically
-    for category in categorized:
-        categorized[category].sort(key=lambda x: x[0])
-
     # Generate formatted Markdown output
     output_lines = ["# Grocery List\n"]
 
@@ -967,6 +1207,23 @@ def generate_grocery_list_from_recipes(
     return "\n".join(output_lines)
 
 
+# Pattern to match recipe names in a meal plan (markdown bold text like
+# **Breakfast Burritos**). These appear as meal titles in the meal plan.
+MEAL_PLAN_TITLE_PATTERN = re.compile(r"\*\*([^*]+)\*\*")
+
+# Exact-match headers: skip pure section labels such as "**Breakfast**"
+MEAL_PLAN_SECTION_TITLES = frozenset({"breakfast", "lunch", "dinner"})
+
+# Substring-based skips: metadata and non-recipe notes
+MEAL_PLAN_SKIP_SUBSTRINGS: Tuple[str, ...] = (
+    "no ",
+    "recipe available",
+    "prep time",
+    "cook time",
+    "total time",
+)
+
+
 def generate_grocery_list_from_meal_plan(meal_plan_path: Path) -> str:
     """Generate a grocery list from a meal plan markdown file.
 
@@ -993,41 +1250,25 @@ def generate_grocery_list_from_meal_plan(meal_plan_path: Path) -> str:
 
     # Extract recipe names from meal plan
     recipe_names: List[str] = []
-
-    with open(meal_plan_path, "r", encoding="utf-8") as f:
-        content = f.read()
-
-        # Pattern to match recipe names (markdown bold headers like **Breakfast Burritos**)
-        # These appear as meal titles in the meal plan
-        pattern = r"\*\*([^*]+)\*\*"
-        matches = re.findall(pattern, content)
-
-        for match in matches:
-            # Normalize matched text for comparison
-            normalized = match.strip().lower()
-
-            # Skip non-recipe headers (like day names, meal section titles, metadata)
-            # Exact-match headers: skip pure section labels such as "**Breakfast**"
-            exact_header_titles = {"breakfast", "lunch", "dinner"}
-
-            # Substring-based skips: metadata and non-recipe notes
-            metadata_substrings = [
-                "no ",
-                "recipe available",
-                "prep time",
-                "cook time",
-                "total time",
-            ]
-
-            if (
-                normalized
-                and normalized not in exact_header_titles
-                and not any(substr in normalized for substr in metadata_substrings)
-            ):
-                # Convert to filename format (e.g., "Breakfast Burritos" -> "breakfast-burritos")
-                recipe_filename = normalized.replace(" ", "-")
-                if recipe_filename not in recipe_names:
-                    recipe_names.append(recipe_filename)
+    seen_recipe_names = set()
+
+    content = meal_plan_path.read_text(encoding="utf-8")
+
+    for match in MEAL_PLAN_TITLE_PATTERN.findall(content):
+        # Normalize matched text for comparison
+        normalized = match.strip().lower()
+
+        # Skip non-recipe headers (like day names, meal section titles, metadata)
+        if (
+            normalized
+            and normalized not in MEAL_PLAN_SECTION_TITLES
+            and not any(substr in normalized for substr in MEAL_PLAN_SKIP_SUBSTRINGS)
+        ):
+            # Convert to filename format (e.g., "Breakfast Burritos" -> "breakfast-burritos")
+            recipe_filename = normalized.replace(" ", "-")
+            if recipe_filename not in seen_recipe_names:
+                seen_recipe_names.add(recipe_filename)
+                recipe_names.append(recipe_filename)
 
     # Get recipes directory (assuming it's at same level as plans directory)
     recipes_dir = meal_plan_path.parent.parent / "recipes"
@@ -12,10 +12,22 @@ Created: 2026-01-18
 """
 
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Optional
 
+# orjson parses JSON several times faster than the standard json module, so
+# use it for history files when it's installed. Without it everything still
+# works the same, just a little slower.
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    # None means "not installed" - checked before every use
+    _orjson_loads = None  # type: ignore[assignment]
+
 
 # ==============================================================================
 # CONFIGURATION
@@ -28,6 +40,25 @@ DEFAULT_HISTORY_TTL_DAYS = 30
 # History file format version for future compatibility
 HISTORY_FILE_VERSION = "1.0"
 
+# Parsed history files we've already read, so unchanged files don't have to
+# be read and parsed again on every call
+# history directory -> {file name: (mtime_ns, size, entry, expiry, expiry_error)}
+# where expiry is the parsed expires_at datetime (or None) and expiry_error
+# is why expires_at couldn't be parsed (or None if it was fine)
+_HISTORY_CACHE: dict[
+    str,
+    dict[str, tuple[int, int, dict[str, Any], Optional[datetime], Optional[str]]],
+] = {}
+
+# History files are named history_<week start>_expires_<expiry date>.json,
+# so expired files can be skipped without opening them. Older files named
+# just history_<week start>.json are still read (and checked inside).
+HISTORY_EXPIRY_IN_FILENAME_PATTERN = re.compile(r"_expires_(\d{4}-\d{2}-\d{2})\.json$")
+
+# Below this many changed history files we just read them one at a time
+# Starting worker threads costs more than it saves for a few small files
+MIN_HISTORY_FILES_FOR_PARALLEL_LOAD = 8
+
 
 # ==============================================================================
 # HISTORY LOGGING FUNCTIONS
@@ -63,12 +94,16 @@ def save_plan_to_history(
     # Ensure history directory exists
     history_dir.mkdir(parents=True, exist_ok=True)
     
+    # Read the clock once so created_at, expires_at and the fallback
+    # filename all agree
+    now = datetime.now()
+
     # Create history entry with metadata
     history_entry = {
         "version": HISTORY_FILE_VERSION,
-        "created_at": datetime.now().isoformat(),
+        "created_at": now.isoformat(),
         "ttl_days": ttl_days,
-        "expires_at": (datetime.now() + timedelta(days=ttl_days)).isoformat(),
+        "expires_at": (now + timedelta(days=ttl_days)).isoformat(),
         "week_start": meal_plan.get("week_start"),
         "week_end": meal_plan.get("week_end"),
         "profile_name": meal_plan.get("profile_name"),
@@ -77,7 +112,7 @@ def save_plan_to_history(
     
     # Extract recipe information from the meal plan
     for day_name, meals in meal_plan.get("week", {}).items():
-        history_entry["meals"][day_name] = {}
+        day_meals = history_entry["meals"][day_name] = {}
         for meal_type, recipe in meals.items():
             # Only store actual recipes that have an associated filename
             recipe_filename = recipe.get("filename") if isinstance(recipe, dict) else None
@@ -85,21 +120,25 @@ def save_plan_to_history(
                 # Skip placeholder or missing recipes without a backing file
                 continue
             # Store key recipe information
-            history_entry["meals"][day_name][meal_type] = {
+            day_meals[meal_type] = {
                 "title": recipe.get("title"),
                 "filename": recipe_filename,
                 "category": recipe.get("Category"),
                 "cuisine": recipe.get("Cuisine"),
             }
     
-    # Create filename based on week start date
-    week_start = meal_plan.get("week_start", datetime.now().strftime("%Y-%m-%d"))
-    filename = f"history_{week_start}.json"
+    # Create filename based on week start date, plus the expiry date so
+    # readers can skip expired files without opening them
+    week_start = meal_plan.get("week_start", now.strftime("%Y-%m-%d"))
+    expires_on = history_entry["expires_at"][:10]
+    filename = f"history_{week_start}_expires_{expires_on}.json"
     history_path = history_dir / filename
     
-    # Save to JSON file
-    with open(history_path, "w", encoding="utf-8") as f:
-        json.dump(history_entry, f, indent=2, ensure_ascii=False)
+    # Save to JSON file (built as one string and written in a single call,
+    # rather than json.dump's many small writes)
+    history_path.write_text(
+        json.dumps(history_entry, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
     
     return history_path
 
@@ -109,6 +148,67 @@ def save_plan_to_history(
 # ==============================================================================
 
 
+def _expired_by_filename(filename: str, today: str) -> bool:
+    """Check whether a history file's name shows it expired before today.
+    
+    Args:
+        filename: History file name, like
+                  "history_2026-01-19_expires_2026-02-18.json"
+        today: Today's date as YYYY-MM-DD
+        
+    Returns:
+        True if the expiry date in the name is before today, False if it
+        isn't or the name has no expiry date
+        
+    Example:
+        _expired_by_filename(
+            "history_2026-01-19_expires_2026-02-18.json", "2026-03-01"
+        )  # Returns True
+    """
+    match = HISTORY_EXPIRY_IN_FILENAME_PATTERN.search(filename)
+    # YYYY-MM-DD strings sort the same way as the dates they hold
+    return match is not None and match.group(1) < today
+
+
+def _read_history_file(
+    path: str,
+) -> tuple[dict[str, Any], Optional[datetime], Optional[str]]:
+    """Read one history file and parse its expiry date.
+    
+    The expiry is parsed here, once per read, rather than on every call.
+    A bad date isn't raised; its error message is kept and reported when
+    it matters.
+    
+    Args:
+        path: Path to the history JSON file
+        
+    Returns:
+        Tuple of (entry, expiry, expiry_error) where expiry is the expires_at
+        datetime (None if there isn't one or it couldn't be parsed) and
+        expiry_error is the message from parsing it (None if it was fine)
+        
+    Example:
+        path = "history/history_2026-01-19_expires_2026-02-02.json"
+        entry, expiry, expiry_error = _read_history_file(path)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    
+    # Both raise a ValueError for bad JSON or text that isn't UTF-8
+    if _orjson_loads is not None:
+        entry = _orjson_loads(data)
+    else:
+        entry = json.loads(data.decode("utf-8"))
+    
+    expires_at_str = entry.get("expires_at")
+    try:
+        expiry = datetime.fromisoformat(expires_at_str) if expires_at_str else None
+    except (TypeError, ValueError) as e:
+        return entry, None, str(e)
+    
+    return entry, expiry, None
+
+
 def load_history_entries(
     history_dir: Path,
     include_expired: bool = False,
@@ -116,44 +216,146 @@ def load_history_entries(
     """Load all history entries from the history directory.
     
     This reads all JSON history files and optionally filters out expired ones.
+    If a week was saved more than once, only its most recently created file
+    is used.
     
     Args:
         history_dir: Directory containing history files
         include_expired: Whether to include expired history entries (default: False)
         
     Returns:
-        List of history entry dictionaries, sorted by date (newest first)
+        List of history entry dictionaries, sorted by date (newest first).
+        Nested data (like "meals") is shared with the history cache, so
+        treat it as read-only.
         
     Example:
         history = load_history_entries(Path("history/"))
         print(f"Found {len(history)} recent meal plans")
     """
-    if not history_dir.exists():
+    try:
+        with os.scandir(history_dir) as scan:
+            history_files = sorted(
+                (
+                    dir_entry
+                    for dir_entry in scan
+                    if dir_entry.name.startswith("history_")
+                    and dir_entry.name.endswith(".json")
+                ),
+                key=lambda dir_entry: dir_entry.name,
+            )
+    except (FileNotFoundError, NotADirectoryError):
         return []
     
     entries = []
     now = datetime.now()
     
-    # Read all JSON files in the history directory
-    for history_file in history_dir.glob("history_*.json"):
+    # Skip files whose name says they expired before today, without
+    # opening them. (Files expiring today still get checked inside, since
+    # that depends on the time.)
+    if not include_expired:
+        today = now.date().isoformat()
+        history_files = [
+            history_file
+            for history_file in history_files
+            if not _expired_by_filename(history_file.name, today)
+        ]
+    
+    # Only files seen this time are kept in the cache, so deleted files
+    # are forgotten
+    dir_key = str(history_dir)
+    old_cache = _HISTORY_CACHE.get(dir_key, {})
+    new_cache = {}
+    
+    # Find the files that are new or changed since we last read them
+    unchanged = {}
+    stale_files = []
+    for history_file in history_files:
+        stat = history_file.stat()
+        cached = old_cache.get(history_file.name)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            unchanged[history_file.name] = cached
+        else:
+            stale_files.append(history_file)
+    
+    # For a lot of changed files, start reading them all at the same time
+    # since most of the work is waiting on the disk. Any error is raised
+    # again by .result() in the loop below, just like a normal read.
+    pending_reads = {}
+    if len(stale_files) >= MIN_HISTORY_FILES_FOR_PARALLEL_LOAD:
+        with ThreadPoolExecutor(max_workers=min(32, len(stale_files))) as executor:
+            for history_file in stale_files:
+                pending_reads[history_file.name] = executor.submit(
+                    _read_history_file, history_file.path
+                )
+    
+    # Read all JSON files in the history directory, keeping the latest
+    # one for each week: week start -> (file name, entry, expiry, expiry_error)
+    latest_by_week: dict[
+        str, tuple[str, dict[str, Any], Optional[datetime], Optional[str]]
+    ] = {}
+    for history_file in history_files:
         try:
-            with open(history_file, "r", encoding="utf-8") as f:
-                entry = json.load(f)
-            
-            # Check if entry is expired
-            if not include_expired:
-                expires_at_str = entry.get("expires_at")
-                if expires_at_str:
-                    expires_at = datetime.fromisoformat(expires_at_str)
-                    if now > expires_at:
-                        continue  # Skip expired entry
-            
-            entries.append(entry)
+            stat = history_file.stat()
+            cached = unchanged.get(history_file.name)
+            if cached:
+                # File hasn't changed since we last read it
+                entry, expiry, expiry_error = cached[2], cached[3], cached[4]
+            elif history_file.name in pending_reads:
+                entry, expiry, expiry_error = pending_reads[
+                    history_file.name
+                ].result()
+            else:
+                entry, expiry, expiry_error = _read_history_file(history_file.path)
+            new_cache[history_file.name] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                entry,
+                expiry,
+                expiry_error,
+            )
             
         except (json.JSONDecodeError, ValueError) as e:
             # Log warning but continue processing other files
             print(f"⚠️  Warning: Could not read history file {history_file.name}: {e}")
             continue
+        
+        # Saving a week again on a later day writes a new file (its expiry
+        # date is in the name) and leaves the earlier one alone, so only
+        # the most recently created file for each week counts. Files are in
+        # name order, so on a tie the later name wins.
+        week_start = entry.get("week_start")
+        if not isinstance(week_start, str) or not week_start:
+            week_start = history_file.name  # Can't group it - keep it as is
+        latest = latest_by_week.get(week_start)
+        created_at = str(entry.get("created_at", ""))
+        if latest is None or created_at >= str(latest[1].get("created_at", "")):
+            latest_by_week[week_start] = (
+                history_file.name,
+                entry,
+                expiry,
+                expiry_error,
+            )
+    
+    _HISTORY_CACHE[dir_key] = new_cache
+    
+    for name, entry, expiry, expiry_error in latest_by_week.values():
+        # Check if entry is expired
+        if not include_expired:
+            if expiry_error is not None:
+                # Can't tell whether it expired, so skip it like an
+                # unreadable file
+                print(
+                    f"⚠️  Warning: Could not read history file {name}: "
+                    f"{expiry_error}"
+                )
+                continue
+            if expiry is not None and now > expiry:
+                continue  # Skip expired entry
+        
+        # Hand out a shallow copy: callers can add or replace top-level
+        # keys without touching the cache, but nested data like "meals"
+        # is shared with it and must be treated as read-only
+        entries.append(dict(entry))
     
     # Sort by week_start date (newest first)
     entries.sort(
@@ -164,6 +366,54 @@ def load_history_entries(
     return entries
 
 
+def _parse_week_start(week_start_str: str) -> datetime:
+    """Parse a YYYY-MM-DD week start date.
+    
+    The usual zero-padded form is read by slicing out the numbers, which is
+    much quicker than strptime. Anything else goes through strptime.
+    
+    Args:
+        week_start_str: Date string like "2026-01-19"
+        
+    Returns:
+        datetime at midnight of that day
+        
+    Raises:
+        ValueError: If the string isn't a valid YYYY-MM-DD date
+        
+    Example:
+        week_start = _parse_week_start("2026-01-19")
+        print(week_start.strftime("%A"))  # Monday
+    """
+    if (
+        len(week_start_str) == 10
+        and week_start_str[4] == "-"
+        and week_start_str[7] == "-"
+        and week_start_str.isascii()
+    ):
+        year = week_start_str[0:4]
+        month = week_start_str[5:7]
+        day = week_start_str[8:10]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            # datetime() raises ValueError for impossible dates, like strptime
+            return datetime(int(year), int(month), int(day))
+    
+    return datetime.strptime(week_start_str, "%Y-%m-%d")
+
+
+def clear_history_cache() -> None:
+    """Forget all cached history files, so the next load reads them again.
+    
+    Files are re-read automatically when they change, so this is only
+    needed if a file is replaced without its size or timestamp changing.
+    
+    Example:
+        clear_history_cache()
+        history = load_history_entries(Path("history/"))
+    """
+    _HISTORY_CACHE.clear()
+
+
 def get_recently_used_recipes(
     history_dir: Path,
     days_back: int = DEFAULT_HISTORY_TTL_DAYS,
@@ -196,12 +446,17 @@ def get_recently_used_recipes(
         
         # Parse week start date
         try:
-            week_start = datetime.strptime(week_start_str, "%Y-%m-%d")
+            week_start = _parse_week_start(week_start_str)
         except ValueError:
             continue
         
-        # Skip if too old
+        # Skip if too old. Entries come newest first, so once a normal
+        # YYYY-MM-DD week is too old, every entry after it is too.
+        # (Odd unpadded dates like "2026-1-5" don't sort by date, so for
+        # those we just skip the one entry.)
         if week_start < cutoff_date:
+            if len(week_start_str) == 10:
+                break
             continue
         
         # Extract all recipes from this week
@@ -221,6 +476,59 @@ def get_recently_used_recipes(
     return recently_used
 
 
+def _build_recipe_last_used_index(
+    history_dir: Path,
+    days_back: int = DEFAULT_HISTORY_TTL_DAYS,
+) -> dict[str, str]:
+    """Map each recently used recipe filename to the latest week it was used.
+    
+    This walks the history once, so looking up a recipe afterwards is just a
+    dictionary lookup instead of a scan over every meal of every week.
+    
+    Args:
+        history_dir: Directory containing history files
+        days_back: How many days back to look (default: 30)
+        
+    Returns:
+        Dictionary of recipe filename -> latest week start (YYYY-MM-DD)
+        
+    Example:
+        index = _build_recipe_last_used_index(Path("history/"))
+        print(index.get("breakfast-burritos.md"))
+    """
+    entries = load_history_entries(history_dir, include_expired=False)
+    last_used: dict[str, str] = {}
+    cutoff_date = datetime.now() - timedelta(days=days_back)
+    
+    for entry in entries:
+        week_start_str = entry.get("week_start")
+        if not week_start_str:
+            continue
+        
+        # Same rules as get_recently_used_recipes: skip bad and old weeks
+        try:
+            week_start = _parse_week_start(week_start_str)
+        except ValueError:
+            continue
+        if week_start < cutoff_date:
+            if len(week_start_str) == 10:
+                break
+            continue
+        
+        for meals in entry.get("meals", {}).values():
+            for recipe_info in meals.values():
+                filename = recipe_info.get("filename")
+                if not filename:
+                    continue
+                
+                # YYYY-MM-DD strings sort the same way as the dates they hold
+                previous = last_used.get(filename)
+                if previous is None or week_start_str > previous:
+                    last_used[filename] = week_start_str
+    
+    return last_used
+
+
 def get_recipe_last_used(
     recipe_filename: str,
     history_dir: Path,
@@ -239,14 +547,7 @@ def get_recipe_last_used(
         if last_used:
             print(f"Recipe last used on {last_used}")
     """
-    recent_recipes = get_recently_used_recipes(history_dir)
-    
-    # Find the most recent use of this recipe
-    for recipe in recent_recipes:
-        if recipe.get("filename") == recipe_filename:
-            return recipe.get("date")
-    
-    return None
+    return _build_recipe_last_used_index(history_dir).get(recipe_filename)
 
 
 def days_since_recipe_used(
@@ -277,7 +578,7 @@ def days_since_recipe_used(
         reference_date = datetime.now()
     
     try:
-        last_used = datetime.strptime(last_used_str, "%Y-%m-%d")
+        last_used = _parse_week_start(last_used_str)
         delta = reference_date - last_used
         return delta.days
     except ValueError:
@@ -11,6 +11,7 @@ Key Features:
 - Prompt engineering optimized for meal suggestions
 - Constraint-aware meal generation
 - Graceful fallback when API is unavailable
+- Recent answers saved on disk, so repeated prompts skip the API call
 - Comprehensive error handling
 
 How It Works:
@@ -38,17 +39,25 @@ Author: THC Meal Prep Planner Team
 Created: 2026-01-18
 """
 
+import hashlib
+import importlib.util
+import json
 import os
-from typing import Any, Optional
-
-# Try to import OpenAI, but don't fail if it's not available
+import re
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+# Check whether OpenAI is installed, but don't import it yet
+# Importing the openai package is slow, and most runs never create a client
+# (no API key, or plans served from cache), so we only import it in
+# get_openai_client when we actually need it
 # This allows the script to run without LLM features if the package isn't installed
-try:
+OPENAI_AVAILABLE = importlib.util.find_spec("openai") is not None
+
+if TYPE_CHECKING:
     from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-    OpenAI = None  # type: ignore
 
 
 # ==============================================================================
@@ -68,10 +77,65 @@ MAX_TOKENS = 150
 # 0.7 provides a good balance between creativity and consistency
 TEMPERATURE = 0.7
 
+# System message sent with every request, telling the LLM what role to play
+MEAL_SUGGESTION_SYSTEM_MESSAGE = (
+    "You are a helpful meal planning assistant. "
+    "Provide concise, practical meal suggestions."
+)
+
+# The prompt for a single meal suggestion, filled in by
+# build_meal_suggestion_prompt. {recent_meals_block} is either empty or a
+# "Recently used meals" line followed by a blank line.
+MEAL_SUGGESTION_PROMPT_TEMPLATE = """You are a creative meal planning assistant. Suggest a {meal_type} meal idea.
+
+Context:
+- Meal type: {meal_type}
+- Day type: {time_context}
+- Maximum preparation time: {max_time} minutes
+- Dietary restrictions: {dietary_restrictions}
+- Food preferences: {food_preferences}
+
+{recent_meals_block}Please suggest ONE specific meal name only. Keep it simple and practical.
+Format: Just the meal name, nothing else.
+Example: "Chicken Teriyaki with Rice" or "Veggie Omelet"
+
+Meal suggestion:"""
+
 # Maximum length for user-provided strings to prevent prompt injection
 # This limits the size of meal names, dietary restrictions, etc. in prompts
 MAX_INPUT_LENGTH = 500
 
+# Matches every character that isn't allowed in prompts
+# Allowed: letters, digits, spaces and common punctuation. Everything else
+# (control characters, emoji, brackets, etc.) gets removed by sanitize_input.
+DISALLOWED_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9 .,;:!?\-'\"()/&]")
+
+# How many different strings to remember the sanitized version of
+# Profile fields and recent meal names repeat for every meal in a plan
+SANITIZE_CACHE_SIZE = 1024
+
+# OpenAI clients we've already created, by API key
+# Making a client sets up a new connection pool, so we only do it once
+_OPENAI_CLIENTS: dict[str, "OpenAI"] = {}
+
+# Quote marks to trim from around LLM answers: straight quotes plus the
+# curly “ ” ‘ ’ versions
+QUOTE_CHARS = "\"'\u201c\u201d\u2018\u2019"
+
+# Where answers from the LLM are saved, so asking the exact same question
+# again (same prompt, model and settings) doesn't cost another API call
+# Set THC_LLM_CACHE_DIR to use a different folder
+SUGGESTION_CACHE_DIR = Path(
+    os.environ.get(
+        "THC_LLM_CACHE_DIR",
+        Path.home() / ".cache" / "thc-meal-planner" / "llm",
+    )
+)
+
+# How long a saved answer is reused before we ask the LLM again
+# Suggestions go stale as the list of recently used meals changes
+SUGGESTION_CACHE_TTL_DAYS = 7
+
 
 # ==============================================================================
 # HELPER FUNCTIONS
@@ -100,8 +164,29 @@ def sanitize_input(text: str, max_length: int = MAX_INPUT_LENGTH) -> str:
     if not text:
         return ""
     
-    # Convert to string and strip
-    text = str(text).strip()
+    # Convert to string, then clean it (or reuse the result from last time)
+    return _sanitize_text(str(text), max_length)
+
+
+@lru_cache(maxsize=SANITIZE_CACHE_SIZE)
+def _sanitize_text(text: str, max_length: int) -> str:
+    """Do the actual cleaning for sanitize_input, remembering the results.
+    
+    The same profile fields and recent meal names get sanitized for every
+    meal in a plan, so each unique string is only cleaned once.
+    
+    Args:
+        text: The text to sanitize
+        max_length: Maximum allowed length
+        
+    Returns:
+        Sanitized text safe for use in prompts
+        
+    Example:
+        safe_text = _sanitize_text("Veggie Omelet", MAX_INPUT_LENGTH)
+    """
+    # Strip surrounding whitespace
+    text = text.strip()
     
     # Limit length to prevent abuse
     if len(text) > max_length:
@@ -109,13 +194,8 @@ def sanitize_input(text: str, max_length: int = MAX_INPUT_LENGTH) -> str:
     
     # Remove or escape potentially problematic characters
     # Keep alphanumeric, spaces, common punctuation, but remove control chars
-    allowed_chars = set(
-        "abcdefghijklmnopqrstuvwxyz"
-        "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
-        "0123456789"
-        " .,;:!?-'\"()/&"
-    )
-    sanitized = "".join(c for c in text if c in allowed_chars)
+    # (one regex pass instead of checking each character in Python)
+    sanitized = DISALLOWED_CHARS_PATTERN.sub("", text)
     
     # Normalize whitespace
     sanitized = " ".join(sanitized.split())
@@ -148,8 +228,11 @@ def is_llm_available() -> bool:
     return api_key is not None and api_key.strip() != ""
 
 
-def get_openai_client() -> Optional[OpenAI]:
-    """Create and return an OpenAI client instance.
+def get_openai_client() -> Optional["OpenAI"]:
+    """Create (or reuse) and return an OpenAI client instance.
+    
+    The client is created once per API key and then reused, so repeated
+    calls share its connections instead of opening new ones each time.
     
     This function safely creates an OpenAI client, handling cases where:
     - The OpenAI package is not installed
@@ -168,9 +251,20 @@ def get_openai_client() -> Optional[OpenAI]:
     if not is_llm_available():
         return None
     
+    # Reuse the client we already made for this key, so its open
+    # connections carry over from one API call to the next
+    api_key = os.environ.get("OPENAI_API_KEY")
+    if api_key is None:
+        return None
+    client = _OPENAI_CLIENTS.get(api_key)
+    if client is not None:
+        return client
+    
     try:
-        api_key = os.environ.get("OPENAI_API_KEY")
+        from openai import OpenAI
+
         client = OpenAI(api_key=api_key)
+        _OPENAI_CLIENTS[api_key] = client
         return client
     except Exception as e:
         print(f"⚠️  Warning: Failed to create OpenAI client: {e}")
@@ -233,34 +327,125 @@ def build_meal_suggestion_prompt(
     # Sanitize meal type
     meal_type_safe = sanitize_input(meal_type)
     
-    # Build the prompt
-    prompt = f"""You are a creative meal planning assistant. Suggest a {meal_type_safe} meal idea.
-
-Context:
-- Meal type: {meal_type_safe}
-- Day type: {time_context}
-- Maximum preparation time: {max_time} minutes
-- Dietary restrictions: {dietary_restrictions}
-- Food preferences: {food_preferences}
-
-"""
-    
     # Add recently used meals to avoid repetition
     # Sanitize each meal name to prevent prompt injection
+    recent_meals_block = ""
     if recently_used_meals:
         sanitized_meals = [sanitize_input(meal) for meal in recently_used_meals]
         # Filter out empty strings after sanitization
         sanitized_meals = [m for m in sanitized_meals if m]
         if sanitized_meals:
-            prompt += f"Recently used meals (please avoid): {', '.join(sanitized_meals)}\n\n"
+            recent_meals_block = (
+                f"Recently used meals (please avoid): {', '.join(sanitized_meals)}\n\n"
+            )
     
-    prompt += """Please suggest ONE specific meal name only. Keep it simple and practical.
-Format: Just the meal name, nothing else.
-Example: "Chicken Teriyaki with Rice" or "Veggie Omelet"
+    # Fill in the prompt template in one go
+    return MEAL_SUGGESTION_PROMPT_TEMPLATE.format_map({
+        "meal_type": meal_type_safe,
+        "time_context": time_context,
+        "max_time": max_time,
+        "dietary_restrictions": dietary_restrictions,
+        "food_preferences": food_preferences,
+        "recent_meals_block": recent_meals_block,
+    })
+
+
+def _suggestion_cache_path(prompt: str) -> Path:
+    """Get the cache file for the answer to a prompt.
+    
+    The file name is a hash of everything that affects the answer: the
+    prompt plus the model and sampling settings.
+    
+    Args:
+        prompt: The prompt sent to the LLM
+        
+    Returns:
+        Path of the cache file (which may not exist yet)
+        
+    Example:
+        path = _suggestion_cache_path(prompt)
+    """
+    key_text = f"{DEFAULT_MODEL}\n{MAX_TOKENS}\n{TEMPERATURE}\n{prompt}"
+    key = hashlib.blake2b(key_text.encode("utf-8"), digest_size=16).hexdigest()
+    return SUGGESTION_CACHE_DIR / f"{key}.json"
 
-Meal suggestion:"""
+
+def load_cached_suggestion(prompt: str) -> Optional[str]:
+    """Get a saved LLM answer for this exact prompt, if there's a recent one.
+    
+    Args:
+        prompt: The prompt that would be sent to the LLM
+        
+    Returns:
+        The saved meal suggestion, or None if there isn't one, it's older
+        than SUGGESTION_CACHE_TTL_DAYS, or the cache can't be read
+        
+    Example:
+        suggestion = load_cached_suggestion(prompt)
+        if suggestion:
+            print(f"Reusing earlier suggestion: {suggestion}")
+    """
+    cache_path = _suggestion_cache_path(prompt)
+    try:
+        age_seconds = time.time() - cache_path.stat().st_mtime
+        if age_seconds > SUGGESTION_CACHE_TTL_DAYS * 24 * 60 * 60:
+            return None
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        # Missing or unreadable cache just means we ask the LLM
+        return None
     
-    return prompt
+    suggestion = cached.get("suggestion") if isinstance(cached, dict) else None
+    return suggestion if isinstance(suggestion, str) and suggestion else None
+
+
+def save_cached_suggestion(prompt: str, suggestion: str) -> None:
+    """Save an LLM answer so the same prompt can reuse it later.
+    
+    Failing to save is not an error - the suggestion just won't be reused.
+    
+    Args:
+        prompt: The prompt that was sent to the LLM
+        suggestion: The cleaned-up meal suggestion it returned
+        
+    Example:
+        save_cached_suggestion(prompt, "Veggie Omelet")
+    """
+    cache_path = _suggestion_cache_path(prompt)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(
+            json.dumps({"suggestion": suggestion}),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        print(f"⚠️  Warning: Could not save LLM suggestion to cache: {e}")
+
+
+def clean_suggestion(suggestion: Optional[str]) -> Optional[str]:
+    """Clean up a meal name returned by the LLM.
+    
+    Args:
+        suggestion: Raw text from the LLM
+        
+    Returns:
+        The meal name without quotes and extra whitespace, or None if empty
+        
+    Example:
+        clean_suggestion(' "Veggie  Omelet" ')  # Returns "Veggie Omelet"
+    """
+    if not suggestion:
+        return None
+    
+    # Clean up the suggestion more robustly
+    # Remove various quote types and extra whitespace
+    suggestion = suggestion.strip()
+    # Remove common quote patterns (both ASCII and Unicode variants)
+    # in one pass - strip() removes any mix of these from both ends
+    suggestion = suggestion.strip(QUOTE_CHARS)
+    # Final whitespace normalization
+    suggestion = " ".join(suggestion.split())
+    return suggestion if suggestion else None
 
 
 # ==============================================================================
@@ -281,9 +466,10 @@ def get_meal_suggestion(
     It handles the entire flow:
     1. Check if LLM is available
     2. Build an appropriate prompt
-    3. Call the OpenAI API
-    4. Extract and clean the response
-    5. Handle errors gracefully
+    3. Reuse a recent answer to the same prompt, if one is saved
+    4. Otherwise call the OpenAI API (and save the answer)
+    5. Read the first line of the streamed response and clean it up
+    6. Handle errors gracefully
     
     The function always returns None if:
     - LLM is not available (no API key or package not installed)
@@ -319,8 +505,7 @@ def get_meal_suggestion(
         recently_used_meals = []
     
     # Check if LLM features are available
-    client = get_openai_client()
-    if not client:
+    if not is_llm_available():
         return None
     
     try:
@@ -333,14 +518,22 @@ def get_meal_suggestion(
             recently_used_meals,
         )
         
-        # Call the OpenAI API
-        response = client.chat.completions.create(
+        # If we asked this exact question recently, reuse the answer
+        cached_suggestion = load_cached_suggestion(prompt)
+        if cached_suggestion:
+            return cached_suggestion
+        
+        client = get_openai_client()
+        if not client:
+            return None
+        
+        # Call the OpenAI API, streaming the answer back piece by piece
+        stream = client.chat.completions.create(
             model=DEFAULT_MODEL,
             messages=[
                 {
                     "role": "system",
-                    "content": "You are a helpful meal planning assistant. "
-                               "Provide concise, practical meal suggestions."
+                    "content": MEAL_SUGGESTION_SYSTEM_MESSAGE,
                 },
                 {
                     "role": "user",
@@ -349,24 +542,31 @@ def get_meal_suggestion(
             ],
             max_tokens=MAX_TOKENS,
             temperature=TEMPERATURE,
+            stream=True,
         )
         
         # Extract the suggestion from the response
-        if response.choices and len(response.choices) > 0:
-            suggestion = response.choices[0].message.content
-            if suggestion:
-                # Clean up the suggestion more robustly
-                # Remove various quote types and extra whitespace
-                suggestion = suggestion.strip()
-                # Remove common quote patterns (both ASCII and Unicode variants)
-                quote_chars = {'"', "'", '"', '"', "'", "'"}
-                for quote_char in quote_chars:
-                    suggestion = suggestion.strip(quote_char)
-                # Final whitespace normalization
-                suggestion = " ".join(suggestion.split())
-                return suggestion if suggestion else None
+        # We only want the meal name on the first line, so stop reading
+        # (and stop the LLM writing) as soon as that line is finished
+        parts = []
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content
+                if not text:
+                    continue
+                parts.append(text)
+                if "\n" in text and "".join(parts).strip():
+                    break
+        finally:
+            stream.close()
         
-        return None
+        first_line = "".join(parts).strip().split("\n", 1)[0]
+        suggestion = clean_suggestion(first_line)
+        if suggestion:
+            save_cached_suggestion(prompt, suggestion)
+        return suggestion
         
     except Exception as e:
         # Log the error but don't crash - gracefully degrade to non-LLM mode
@@ -13,7 +13,9 @@ Author: THC Meal Prep Planner Team
 Created: 2026-01-18
 """
 
-from typing import Any, Optional
+import re
+from bisect import bisect_right
+from typing import Any, Optional, Union
 
 # Try to import LLM utilities for cuisine classification
 try:
@@ -43,14 +45,223 @@ PENALTY_VALUES = {
 }
 
 
+# Minimum total score for each grade, lowest first
+# Below 0 is an F, 0+ is a D, 50+ a C, 100+ a B, 150+ an A and 200+ an A+
+GRADE_THRESHOLDS = (0, 50, 100, 150, 200)
+GRADES = ("F", "D", "C", "B", "A", "A+")
+
+# What the scoring functions need from a meal plan, pulled out in one pass:
+# one (day_name, meals, details) tuple per day, where details holds
+# (meal_type, title, cuisine, filename) for each of that day's meals
+PlanDays = list[tuple[str, dict[str, Any], list[tuple[str, Any, Any, Any]]]]
+
+# Cuisine values (after trimming and lowercasing) that mean "we don't know"
+UNKNOWN_CUISINE_VALUES = frozenset(("unknown", ""))
+
+# Cuisine strings we've already checked and found to be real cuisines
+# The same handful ("Mexican", "Asian", ...) come up for every meal, so
+# this saves trimming and lowercasing them again each time
+_KNOWN_CUISINES: set[str] = set()
+
+# Words in a recipe title that give away its cuisine
+# These are checked before asking the LLM, since a title like "Fish Tacos"
+# doesn't need an API call to know it's Mexican
+CUISINE_KEYWORDS = {
+    "mexican": "Mexican",
+    "taco": "Mexican",
+    "tacos": "Mexican",
+    "burrito": "Mexican",
+    "burritos": "Mexican",
+    "enchilada": "Mexican",
+    "enchiladas": "Mexican",
+    "quesadilla": "Mexican",
+    "quesadillas": "Mexican",
+    "fajita": "Mexican",
+    "fajitas": "Mexican",
+    "tamale": "Mexican",
+    "tamales": "Mexican",
+    "nachos": "Mexican",
+    "chilaquiles": "Mexican",
+    "italian": "Italian",
+    "pasta": "Italian",
+    "spaghetti": "Italian",
+    "lasagna": "Italian",
+    "risotto": "Italian",
+    "pizza": "Italian",
+    "gnocchi": "Italian",
+    "carbonara": "Italian",
+    "pesto": "Italian",
+    "marinara": "Italian",
+    "fettuccine": "Italian",
+    "alfredo": "Italian",
+    "penne": "Italian",
+    "ravioli": "Italian",
+    "minestrone": "Italian",
+    "caprese": "Italian",
+    "indian": "Indian",
+    "curry": "Indian",
+    "tikka": "Indian",
+    "masala": "Indian",
+    "tandoori": "Indian",
+    "biryani": "Indian",
+    "paneer": "Indian",
+    "korma": "Indian",
+    "vindaloo": "Indian",
+    "dal": "Indian",
+    "dahl": "Indian",
+    "thai": "Thai",
+    "pad thai": "Thai",
+    "green curry": "Thai",
+    "red curry": "Thai",
+    "tom yum": "Thai",
+    "chinese": "Chinese",
+    "lo mein": "Chinese",
+    "chow mein": "Chinese",
+    "kung pao": "Chinese",
+    "general tso": "Chinese",
+    "sweet and sour": "Chinese",
+    "japanese": "Japanese",
+    "teriyaki": "Japanese",
+    "sushi": "Japanese",
+    "ramen": "Japanese",
+    "miso": "Japanese",
+    "katsu": "Japanese",
+    "udon": "Japanese",
+    "tempura": "Japanese",
+    "korean": "Korean",
+    "bibimbap": "Korean",
+    "bulgogi": "Korean",
+    "kimchi": "Korean",
+    "vietnamese": "Vietnamese",
+    "pho": "Vietnamese",
+    "banh mi": "Vietnamese",
+    "mediterranean": "Mediterranean",
+    "greek": "Mediterranean",
+    "gyro": "Mediterranean",
+    "gyros": "Mediterranean",
+    "souvlaki": "Mediterranean",
+    "falafel": "Mediterranean",
+    "hummus": "Mediterranean",
+    "shawarma": "Mediterranean",
+    "shakshuka": "Mediterranean",
+    "french": "French",
+    "quiche": "French",
+    "ratatouille": "French",
+    "crepes": "French",
+    "spanish": "Spanish",
+    "paella": "Spanish",
+    "gazpacho": "Spanish",
+    "american": "American",
+    "burger": "American",
+    "burgers": "American",
+    "meatloaf": "American",
+    "mac and cheese": "American",
+    "bbq": "American",
+    "barbecue": "American",
+    "sloppy joes": "American",
+}
+
+# Everyday dish names that contain a cuisine word but don't tell us the
+# cuisine ("French Toast" is a breakfast, not a French dinner). When one of
+# these is found, that spot in the title is skipped.
+CUISINE_KEYWORD_EXCLUSIONS = frozenset({
+    "french toast",
+    "french fries",
+    "french dip",
+    "greek yogurt",
+    "spanish rice",
+    "american cheese",
+    "italian dressing",
+})
+
+# One pattern that finds any of the keywords (or excluded dish names) as
+# whole words (any spacing)
+# Longer phrases go first so "pad thai" wins over "thai" and "french toast"
+# wins over "french" at the same spot; the earliest keyword in the title
+# wins ("Thai Green Curry" is Thai)
+CUISINE_KEYWORD_PATTERN = re.compile(
+    r"\b(?:"
+    + "|".join(
+        re.escape(keyword).replace(r"\ ", r"\s+")
+        for keyword in sorted(
+            CUISINE_KEYWORDS.keys() | CUISINE_KEYWORD_EXCLUSIONS,
+            key=len,
+            reverse=True,
+        )
+    )
+    + r")\b",
+    re.IGNORECASE,
+)
+
+# Cuisines the LLM has already given us, by recipe title and ingredients
+# The same recipes get scored over and over, so we only ask once each
+_LLM_CUISINE_CACHE: dict[tuple[str, str], str] = {}
+
+
 # ==============================================================================
 # HELPER FUNCTIONS
 # ==============================================================================
 
 
+def _is_known_cuisine(cuisine: Any) -> bool:
+    """Check whether a recipe's cuisine value names an actual cuisine.
+    
+    Args:
+        cuisine: The recipe's Cuisine value (usually a string, maybe None)
+        
+    Returns:
+        False for missing, blank or "Unknown" cuisines, True otherwise
+        
+    Example:
+        _is_known_cuisine("Mexican")   # Returns True
+        _is_known_cuisine(" unknown")  # Returns False
+    """
+    if not cuisine:
+        return False
+    if not isinstance(cuisine, str):
+        return str(cuisine).strip().lower() not in UNKNOWN_CUISINE_VALUES
+    if cuisine in _KNOWN_CUISINES:
+        return True
+    
+    known = cuisine.strip().lower() not in UNKNOWN_CUISINE_VALUES
+    if known:
+        _KNOWN_CUISINES.add(cuisine)
+    return known
+
+
+def classify_cuisine_by_keywords(recipe_title: str) -> Optional[str]:
+    """Guess the cuisine of a recipe from well-known words in its title.
+    
+    Args:
+        recipe_title: Title of the recipe
+        
+    Returns:
+        Cuisine type, or None if no keyword in the title gives it away
+        
+    Example:
+        cuisine = classify_cuisine_by_keywords("Fish Tacos")
+        # Returns: "Mexican"
+        cuisine = classify_cuisine_by_keywords("French Toast")
+        # Returns: None (a dish name, not a cuisine)
+    """
+    for match in CUISINE_KEYWORD_PATTERN.finditer(recipe_title):
+        # Keywords are stored lowercase with single spaces
+        # Excluded dish names aren't in CUISINE_KEYWORDS, so keep looking
+        cuisine = CUISINE_KEYWORDS.get(" ".join(match.group(0).lower().split()))
+        if cuisine:
+            return cuisine
+    
+    return None
+
+
 def classify_cuisine_with_llm(recipe_title: str, ingredients: str = "") -> Optional[str]:
     """Use LLM to classify the cuisine type of a recipe.
     
+    Titles with an obvious cuisine keyword (see CUISINE_KEYWORDS) are
+    answered locally, even when the LLM isn't available. Each LLM answer is
+    remembered, so the API is only called once for each recipe that really
+    needs it.
+    
     Args:
         recipe_title: Title of the recipe
         ingredients: Optional ingredients list as string
@@ -62,6 +273,11 @@ def classify_cuisine_with_llm(recipe_title: str, ingredients: str = "") -> Optio
         cuisine = classify_cuisine_with_llm("Pad Thai", "rice noodles, peanuts...")
         # Returns: "Thai" or "Asian"
     """
+    # No need to ask the LLM about "Fish Tacos" (works without an API key too)
+    cuisine = classify_cuisine_by_keywords(recipe_title)
+    if cuisine:
+        return cuisine
+    
     if not LLM_AVAILABLE:
         return None
     
@@ -69,6 +285,11 @@ def classify_cuisine_with_llm(recipe_title: str, ingredients: str = "") -> Optio
     if not client:
         return None
     
+    # Reuse the answer if we've asked about this recipe before
+    cache_key = (recipe_title, ingredients)
+    if cache_key in _LLM_CUISINE_CACHE:
+        return _LLM_CUISINE_CACHE[cache_key]
+    
     try:
         prompt = f"""Classify the cuisine type of this recipe. Return only the cuisine name (e.g., Italian, Mexican, Asian, American, Mediterranean, etc.).
 
@@ -90,6 +311,7 @@ Recipe: {recipe_title}"""
         if response.choices and len(response.choices) > 0:
             cuisine = response.choices[0].message.content
             if cuisine:
+                _LLM_CUISINE_CACHE[cache_key] = cuisine.strip()
                 return cuisine.strip()
         
         return None
@@ -103,36 +325,66 @@ Recipe: {recipe_title}"""
 # ==============================================================================
 
 
-def calculate_cuisine_variety_score(meal_plan: dict[str, Any]) -> dict[str, Any]:
-    """Calculate variety score based on cuisine diversity.
+def _extract_plan_days(meal_plan: dict[str, Any]) -> PlanDays:
+    """Pull out the fields the scoring functions need, in one pass over the plan.
     
-    Awards points for using different cuisines throughout the week.
-    Penalties for consecutive days with the same cuisine.
-    Attempts to classify unknown cuisines using LLM if available.
+    Each scorer used to walk the whole week and look up the same recipe
+    fields again. Doing it once here means the week is only walked once,
+    however many scores are calculated from it.
     
     Args:
         meal_plan: The meal plan dictionary
         
     Returns:
-        Dictionary with score and details
+        One (day_name, meals, details) tuple per day, where meals is the
+        day's meal dictionary and details is a list of
+        (meal_type, title, cuisine, filename) for each meal
         
     Example:
-        score = calculate_cuisine_variety_score(meal_plan)
-        print(f"Cuisine variety score: {score['total']}")
+        days = _extract_plan_days(meal_plan)
+        cuisine_score = _score_cuisine_variety(days)
     """
-    cuisines = []
+    days = []
+    for day_name, meals in meal_plan.get("week", {}).items():
+        details = [
+            (
+                meal_type,
+                recipe.get("title"),
+                recipe.get("Cuisine"),
+                recipe.get("filename"),
+            )
+            for meal_type, recipe in meals.items()
+        ]
+        days.append((day_name, meals, details))
+    return days
+
+
+def _score_cuisine_variety(days: PlanDays) -> dict[str, Any]:
+    """Calculate the cuisine variety score from extracted plan days.
+    
+    See calculate_cuisine_variety_score for how the score works.
+    
+    Args:
+        days: Plan days from _extract_plan_days()
+        
+    Returns:
+        Dictionary with score and details
+    """
+    # Only the number of cuisines and how many are different matter, so
+    # keep a running count instead of a list of every cuisine.
+    # Each different cuisine gets its own bit, so a day's cuisines fit in one
+    # number and "do two days share a cuisine?" is a single & between them.
+    cuisine_bits: dict[str, int] = {}
+    total_cuisines = 0
     consecutive_penalties = 0
-    prev_day_cuisines = set()
+    prev_day_mask = 0
     
     # Collect cuisines from each day
-    for day_name, meals in meal_plan.get("week", {}).items():
-        day_cuisines = set()
-        for meal_type, recipe in meals.items():
-            cuisine = recipe.get("Cuisine")
-            
+    for day_name, meals, details in days:
+        day_mask = 0
+        for meal_type, recipe_title, cuisine, filename in details:
             # Try to classify unknown cuisines with LLM
-            if not cuisine or str(cuisine).strip().lower() in ("unknown", ""):
-                recipe_title = recipe.get("title", "")
+            if not _is_known_cuisine(cuisine):
                 # Only attempt classification for actual recipes, not placeholders
                 if recipe_title and not recipe_title.startswith("No "):
                     classified = classify_cuisine_with_llm(recipe_title)
@@ -144,18 +396,21 @@ def calculate_cuisine_variety_score(meal_plan: dict[str, Any]) -> dict[str, Any]
                     cuisine = "Unknown"
             
             # Only add known cuisines to the variety calculation
-            if cuisine and str(cuisine).strip().lower() != "unknown":
-                cuisines.append(cuisine)
-                day_cuisines.add(cuisine)
+            if _is_known_cuisine(cuisine):
+                total_cuisines += 1
+                bit = cuisine_bits.get(cuisine)
+                if bit is None:
+                    bit = cuisine_bits[cuisine] = 1 << len(cuisine_bits)
+                day_mask |= bit
         
         # Check for consecutive days sharing any cuisine
-        if prev_day_cuisines and (prev_day_cuisines & day_cuisines):
+        if prev_day_mask & day_mask:
             consecutive_penalties += 1
         
-        prev_day_cuisines = day_cuisines
+        prev_day_mask = day_mask
     
     # Calculate score - only count known cuisines
-    unique_cuisines = len(set(cuisines))
+    unique_cuisines = len(cuisine_bits)
     variety_points = unique_cuisines * SCORING_WEIGHTS["cuisine_variety"]
     penalty_points = consecutive_penalties * PENALTY_VALUES["consecutive_same_cuisine"]
     
@@ -164,40 +419,36 @@ def calculate_cuisine_variety_score(meal_plan: dict[str, Any]) -> dict[str, Any]
         "variety_points": variety_points,
         "penalty_points": penalty_points,
         "unique_cuisines": unique_cuisines,
-        "total_cuisines": len(cuisines),
+        "total_cuisines": total_cuisines,
         "consecutive_penalties": consecutive_penalties,
     }
 
 
-def calculate_recipe_diversity_score(meal_plan: dict[str, Any]) -> dict[str, Any]:
-    """Calculate variety score based on recipe diversity.
+def _score_recipe_diversity(days: PlanDays) -> dict[str, Any]:
+    """Calculate the recipe diversity score from extracted plan days.
     
-    Awards points for using different recipes throughout the week.
+    See calculate_recipe_diversity_score for how the score works.
     
     Args:
-        meal_plan: The meal plan dictionary
+        days: Plan days from _extract_plan_days()
         
     Returns:
         Dictionary with score and details
-        
-    Example:
-        score = calculate_recipe_diversity_score(meal_plan)
-        print(f"Recipe diversity score: {score['total']}")
     """
-    recipes = []
-    
-    # Collect all recipes used, excluding placeholder entries
-    for day_name, meals in meal_plan.get("week", {}).items():
-        for meal_type, recipe in meals.items():
-            recipe_title = recipe.get("title")
+    # Count all recipes used and remember which ones we've seen,
+    # excluding placeholder entries
+    seen_recipes = set()
+    total_meals = 0
+    for day_name, meals, details in days:
+        for meal_type, recipe_title, cuisine, filename in details:
             # Skip placeholder meals whose titles start with "No "
             # (e.g., "No breakfast recipe available")
             if recipe_title and not recipe_title.startswith("No "):
-                recipes.append(recipe_title)
+                seen_recipes.add(recipe_title)
+                total_meals += 1
     
     # Calculate score
-    unique_recipes = len(set(recipes))
-    total_meals = len(recipes)
+    unique_recipes = len(seen_recipes)
     diversity_points = unique_recipes * SCORING_WEIGHTS["recipe_diversity"]
     
     # Bonus if no recipe is repeated
@@ -215,42 +466,40 @@ def calculate_recipe_diversity_score(meal_plan: dict[str, Any]) -> dict[str, Any
     }
 
 
-def calculate_repetition_penalties(
-    meal_plan: dict[str, Any],
-    recently_used_recipes: list[str],
-    min_days_between_repeats: int = 3,
+def _score_repetition_penalties(
+    days: PlanDays,
+    recently_used_recipes: Union[list[str], set[str], frozenset[str]],
+    min_days_between_repeats: int,
 ) -> dict[str, Any]:
-    """Calculate penalties for recipe repetition violations.
+    """Calculate repetition penalties from extracted plan days.
     
-    Applies penalties for using recipes that were used too recently
-    based on the minimum days between repeats constraint.
+    See calculate_repetition_penalties for how the penalties work.
     
     Args:
-        meal_plan: The meal plan dictionary
-        recently_used_recipes: List of recipe filenames used recently
+        days: Plan days from _extract_plan_days()
+        recently_used_recipes: List (or set) of recipe filenames used recently
         min_days_between_repeats: Minimum days required between repeats
         
     Returns:
         Dictionary with penalty score and details
-        
-    Example:
-        penalties = calculate_repetition_penalties(
-            meal_plan,
-            ["breakfast-burritos.md"],
-            min_days_between_repeats=3
-        )
     """
     violations = []
     
+    # Look filenames up in a set rather than searching the whole list
+    # for every meal (a set that's passed in is used as it is)
+    if isinstance(recently_used_recipes, (set, frozenset)):
+        recent_set = recently_used_recipes
+    else:
+        recent_set = frozenset(recently_used_recipes or ())
+    
     # Check each recipe in the current plan
-    for day_name, meals in meal_plan.get("week", {}).items():
-        for meal_type, recipe in meals.items():
-            recipe_filename = recipe.get("filename")
-            if recipe_filename and recipe_filename in recently_used_recipes:
+    for day_name, meals, details in days:
+        for meal_type, recipe_title, cuisine, recipe_filename in details:
+            if recipe_filename and recipe_filename in recent_set:
                 violations.append({
                     "day": day_name,
                     "meal_type": meal_type,
-                    "recipe": recipe.get("title"),
+                    "recipe": recipe_title,
                     "filename": recipe_filename,
                 })
     
@@ -265,33 +514,32 @@ def calculate_repetition_penalties(
     }
 
 
-def calculate_constraint_penalties(
-    meal_plan: dict[str, Any],
+def _score_constraint_penalties(
+    days: PlanDays,
     constraints: dict[str, Any],
 ) -> dict[str, Any]:
-    """Calculate penalties for constraint violations.
+    """Calculate constraint penalties from extracted plan days.
     
-    Checks for missing required meals and variety constraint violations.
+    See calculate_constraint_penalties for how the penalties work.
     
     Args:
-        meal_plan: The meal plan dictionary
+        days: Plan days from _extract_plan_days()
         constraints: The constraints dictionary
         
     Returns:
         Dictionary with penalty score and details
-        
-    Example:
-        penalties = calculate_constraint_penalties(meal_plan, constraints)
     """
     violations = []
     missing_meals = 0
     variety_violations = 0
     
-    # Get required meals per day
-    meals_per_day = constraints.get("meals_per_day", {})
+    # Look up the constraint sections once (an empty "variety:" or
+    # "meals_per_day:" in the YAML comes through as None, so treat that as {})
+    meals_per_day = constraints.get("meals_per_day") or {}
+    variety_config = constraints.get("variety") or {}
     
     # Check each day for missing meals
-    for day_name, meals in meal_plan.get("week", {}).items():
+    for day_name, meals, details in days:
         for meal_type, required_count in meals_per_day.items():
             if required_count > 0:
                 meal = meals.get(meal_type, {})
@@ -305,17 +553,13 @@ def calculate_constraint_penalties(
                         "meal_type": meal_type,
                     })
     
-    # Check variety constraints
-    variety_config = constraints.get("variety", {})
-    
     # Check min_unique_cuisines constraint
     min_unique_cuisines = variety_config.get("min_unique_cuisines")
     if min_unique_cuisines:
         cuisines = set()
-        for day_name, meals in meal_plan.get("week", {}).items():
-            for meal_type, recipe in meals.items():
-                cuisine = recipe.get("Cuisine")
-                if cuisine and str(cuisine).strip().lower() != "unknown":
+        for day_name, meals, details in days:
+            for meal_type, recipe_title, cuisine, filename in details:
+                if _is_known_cuisine(cuisine):
                     cuisines.add(cuisine)
         
         if len(cuisines) < min_unique_cuisines:
@@ -326,33 +570,6 @@ def calculate_constraint_penalties(
                 "actual": len(cuisines),
             })
     
-    # Check avoid_consecutive_ingredients constraint
-    # DISABLED: This feature is disabled pending a more comprehensive implementation
-    # that properly parses ingredient lists rather than just checking protein.
-    # The current simplified implementation essentially duplicates protein blocking.
-    # TODO: Re-enable with proper ingredient parsing in future iteration
-    if False and variety_config.get("avoid_consecutive_ingredients", False):
-        prev_ingredients = set()
-        for day_name, meals in meal_plan.get("week", {}).items():
-            day_ingredients = set()
-            for meal_type, recipe in meals.items():
-                # Extract main ingredients (this is a simplified version)
-                # In a full implementation, you'd parse the ingredients list
-                protein = recipe.get("Protein")
-                if protein:
-                    day_ingredients.add(protein.lower())
-            
-            # Check for consecutive day overlap
-            if prev_ingredients and (prev_ingredients & day_ingredients):
-                variety_violations += 1
-                violations.append({
-                    "type": "consecutive_ingredients",
-                    "day": day_name,
-                    "ingredients": list(prev_ingredients & day_ingredients),
-                })
-            
-            prev_ingredients = day_ingredients
-    
     # Calculate penalty
     penalty_points = (
         missing_meals * PENALTY_VALUES["missing_meal"]
@@ -367,6 +584,97 @@ def calculate_constraint_penalties(
     }
 
 
+def calculate_cuisine_variety_score(meal_plan: dict[str, Any]) -> dict[str, Any]:
+    """Calculate variety score based on cuisine diversity.
+    
+    Awards points for using different cuisines throughout the week.
+    Penalties for consecutive days with the same cuisine.
+    Attempts to classify unknown cuisines using LLM if available.
+    
+    Args:
+        meal_plan: The meal plan dictionary
+        
+    Returns:
+        Dictionary with score and details
+        
+    Example:
+        score = calculate_cuisine_variety_score(meal_plan)
+        print(f"Cuisine variety score: {score['total']}")
+    """
+    return _score_cuisine_variety(_extract_plan_days(meal_plan))
+
+
+def calculate_recipe_diversity_score(meal_plan: dict[str, Any]) -> dict[str, Any]:
+    """Calculate variety score based on recipe diversity.
+    
+    Awards points for using different recipes throughout the week.
+    
+    Args:
+        meal_plan: The meal plan dictionary
+        
+    Returns:
+        Dictionary with score and details
+        
+    Example:
+        score = calculate_recipe_diversity_score(meal_plan)
+        print(f"Recipe diversity score: {score['total']}")
+    """
+    return _score_recipe_diversity(_extract_plan_days(meal_plan))
+
+
+def calculate_repetition_penalties(
+    meal_plan: dict[str, Any],
+    recently_used_recipes: Union[list[str], set[str], frozenset[str]],
+    min_days_between_repeats: int = 3,
+) -> dict[str, Any]:
+    """Calculate penalties for recipe repetition violations.
+    
+    Applies penalties for using recipes that were used too recently
+    based on the minimum days between repeats constraint.
+    
+    Args:
+        meal_plan: The meal plan dictionary
+        recently_used_recipes: List (or set) of recipe filenames used recently
+        min_days_between_repeats: Minimum days required between repeats
+        
+    Returns:
+        Dictionary with penalty score and details
+        
+    Example:
+        penalties = calculate_repetition_penalties(
+            meal_plan,
+            ["breakfast-burritos.md"],
+            min_days_between_repeats=3
+        )
+    """
+    return _score_repetition_penalties(
+        _extract_plan_days(meal_plan),
+        recently_used_recipes,
+        min_days_between_repeats,
+    )
+
+
+def calculate_constraint_penalties(
+    meal_plan: dict[str, Any],
+    constraints: dict[str, Any],
+) -> dict[str, Any]:
+    """Calculate penalties for constraint violations.
+    
+    Checks for missing required meals and variety constraint violations.
+    
+    Args:
+        meal_plan: The meal plan dictionary
+        constraints: The constraints dictionary
+        
+    Returns:
+        Dictionary with penalty score and details
+        
+    Example:
+        penalties = calculate_constraint_penalties(meal_plan, constraints)
+    """
+    return _score_constraint_penalties(_extract_plan_days(meal_plan), constraints)
+
+
 # ==============================================================================
 # COMPREHENSIVE SCORING
 # ==============================================================================
@@ -375,7 +683,9 @@ def calculate_constraint_penalties(
 def calculate_meal_plan_score(
     meal_plan: dict[str, Any],
     constraints: dict[str, Any],
-    recently_used_recipes: list[str] = None,
+    recently_used_recipes: Optional[
+        Union[list[str], set[str], frozenset[str]]
+    ] = None,
 ) -> dict[str, Any]:
     """Calculate comprehensive variety score for a meal plan.
     
@@ -387,7 +697,7 @@ def calculate_meal_plan_score(
     Args:
         meal_plan: The meal plan dictionary
         constraints: The constraints dictionary
-        recently_used_recipes: List of recently used recipe filenames
+        recently_used_recipes: List (or set) of recently used recipe filenames
         
     Returns:
         Dictionary with total score and detailed breakdown
@@ -397,21 +707,28 @@ def calculate_meal_plan_score(
         print(f"Overall plan score: {score['total_score']}")
         print(f"Grade: {score['grade']}")
     """
+    # A set makes the "was this used recently?" checks quick
     if recently_used_recipes is None:
-        recently_used_recipes = []
+        recently_used_recipes = frozenset()
+    elif not isinstance(recently_used_recipes, (set, frozenset)):
+        recently_used_recipes = frozenset(recently_used_recipes)
+    
+    # Walk the plan once and score everything from what we pulled out
+    days = _extract_plan_days(meal_plan)
     
     # Calculate individual scores
-    cuisine_score = calculate_cuisine_variety_score(meal_plan)
-    recipe_score = calculate_recipe_diversity_score(meal_plan)
+    cuisine_score = _score_cuisine_variety(days)
+    recipe_score = _score_recipe_diversity(days)
     
     # Calculate penalties
-    min_days = constraints.get("variety", {}).get("min_days_between_repeats", 3)
-    repetition_penalty = calculate_repetition_penalties(
-        meal_plan,
+    variety_config = constraints.get("variety") or {}
+    min_days = variety_config.get("min_days_between_repeats", 3)
+    repetition_penalty = _score_repetition_penalties(
+        days,
         recently_used_recipes,
         min_days,
     )
-    constraint_penalty = calculate_constraint_penalties(meal_plan, constraints)
+    constraint_penalty = _score_constraint_penalties(days, constraints)
     
     # Calculate total score
     total_score = (
@@ -422,18 +739,8 @@ def calculate_meal_plan_score(
     )
     
     # Determine grade based on score
-    if total_score >= 200:
-        grade = "A+"
-    elif total_score >= 150:
-        grade = "A"
-    elif total_score >= 100:
-        grade = "B"
-    elif total_score >= 50:
-        grade = "C"
-    elif total_score >= 0:
-        grade = "D"
-    else:
-        grade = "F"
+    # (bisect finds how many thresholds the score reaches: none is an F)
+    grade = GRADES[bisect_right(GRADE_THRESHOLDS, total_score)]
     
     return {
         "total_score": total_score,
@@ -514,9 +821,6 @@ def format_score_summary(score: dict[str, Any]) -> str:
             for v in const.get('violations', []):
                 if v.get('type') == 'insufficient_cuisine_variety':
                     lines.append(f"  - Insufficient cuisine variety: {v.get('actual', 0)} < {v.get('expected', 0)} required")
-                elif v.get('type') == 'consecutive_ingredients':
-                    ingredients = ', '.join(v.get('ingredients', []))
-                    lines.append(f"  - Consecutive ingredients on {v.get('day')}: {ingredients}")
         
         lines.append(f"- **Subtotal**: {const['total']}")
         lines.append("")